@@ -3,6 +3,7 @@ import logging
 import requests
 import time
 import os
+import threading
 from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -96,6 +97,8 @@ class APIClient:
 
         # API 스키마는 더 이상 사용하지 않음 (api_config.yaml 사용)
         self.api_schema = {}
+        # API별 요청 정보 캐시 (get_api_bundle)
+        self._api_bundles: Dict[str, Dict[str, Any]] = {}
 
         # 초기 인증
         if not self.app_key or not self.app_secret:
@@ -404,6 +407,28 @@ class APIClient:
             logger.error("Failed to get access token")
             return None
 
+    def get_api_bundle(self, api_name: str) -> Dict[str, Any]:
+        """API 요청에 필요한 정보를 한 번에 조회 (API별로 캐시)
+
+        Args:
+            api_name: API 이름
+
+        Returns:
+            Dict[str, Any]: method, url_path, tr_id, headers, params 정보
+        """
+        bundle = self._api_bundles.get(api_name)
+        if bundle is None:
+            api_info = self.api_config.get("api_endpoints", {}).get(api_name) or {}
+            bundle = {
+                "method": api_info.get("method", "GET"),
+                "url_path": api_info.get("path", ""),
+                "tr_id": api_info.get("tr_id", ""),
+                "headers": api_info.get("headers", []),
+                "params": api_info.get("params", []),
+            }
+            self._api_bundles[api_name] = bundle
+        return bundle
+
     def _prepare_base_headers(self) -> Dict[str, str]:
         """API 요청을 위한 기본 헤더 구성"""
         token = self.get_access_token()
@@ -732,3 +757,40 @@ class APIClient:
             f"API request failed for {api_name} after {retry_count+1} attempts."
         )
         return {"rt_cd": "97", "msg1": "Max retries reached or unrecoverable error."}
+
+
+# 설정별 APIClient 공유 캐시 (토큰 확인/발급을 프로세스 내에서 한 번만 수행)
+_API_CLIENT_CACHE: Dict[Tuple, APIClient] = {}
+_API_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _freeze_config(value: Any) -> Any:
+    """설정 값을 캐시 키로 쓸 수 있는 해시 가능한 형태로 변환"""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze_config(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_config(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze_config(item) for item in value)
+    return value
+
+
+def get_shared_api_client(
+    api_config: Dict[str, Any], schema_file_path: str = None
+) -> APIClient:
+    """동일한 설정에 대해 하나의 APIClient 인스턴스를 공유하여 반환
+
+    Args:
+        api_config: API 설정 정보 (URL, 키 등)
+        schema_file_path: API 스키마 파일 경로
+
+    Returns:
+        APIClient: 설정별로 캐시된 APIClient 인스턴스
+    """
+    cache_key = (_freeze_config(api_config), schema_file_path)
+    with _API_CLIENT_CACHE_LOCK:
+        client = _API_CLIENT_CACHE.get(cache_key)
+        if client is None:
+            client = APIClient(api_config=api_config, schema_file_path=schema_file_path)
+            _API_CLIENT_CACHE[cache_key] = client
+        return client
@@ -9,15 +9,14 @@
 이벤트 핸들링 및 데이터 분배를 관리합니다.
 """
 
-import os
-import yaml
 import logging
 import importlib
 import traceback
 from typing import Dict, List, Any, Optional, Union, Type
 
 from src.data_collection.abstract_feature import Feature
-from src.data_collection.api_client import APIClient
+from src.data_collection.api_client import get_shared_api_client
+from src.utils.config_loader import load_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +51,7 @@ class FeatureManager:
         self.api_config = self._load_yaml(api_config_yaml_path)
 
         # APIClient 생성 (스키마 파일 사용하지 않음)
-        self.api_client = APIClient(api_config=self.api_config)
+        self.api_client = get_shared_api_client(self.api_config)
 
         # 피처 인스턴스 저장 딕셔너리
         self.features: Dict[str, Feature] = {}
@@ -69,18 +68,7 @@ class FeatureManager:
         Returns:
             Dict: 로드된 설정 정보
         """
-        if not os.path.exists(file_path):
-            logger.warning(f"설정 파일이 존재하지 않습니다: {file_path}")
-            return {}
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
-            logger.info(f"설정 파일 로드 성공: {file_path}")
-            return config
-        except Exception as e:
-            logger.error(f"설정 파일 로드 중 오류 발생: {file_path}, {str(e)}")
-            return {}
+        return load_yaml(file_path)
 
     def _initialize_features(self):
         """features.yaml 설정에 따라 피처 객체 초기화"""
@@ -116,7 +104,10 @@ class FeatureManager:
 
                 # 파라미터 설정 로드
                 param_key = feature_config.get("param_key", "")
-                params = self.params_config.get(param_key, {}) if param_key else {}
+                # 캐시된 설정이 수정되지 않도록 피처별 사본 사용
+                params = (
+                    dict(self.params_config.get(param_key, {})) if param_key else {}
+                )
 
                 # 코드 리스트 설정
                 code_list = feature_config.get("code_list", [])
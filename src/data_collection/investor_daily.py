@@ -8,18 +8,73 @@
 - KOSDAQ (KSQ)
 """
 
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import tempfile
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import time
 import traceback
 
 from src.data_collection.abstract_feature import Feature
 from src.data_collection.api_client import APIClient
+from src.utils.api_optimizer import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# 정수형 다운캐스트 시 오버플로 검사 범위
+_INT32_MIN = np.iinfo(np.int32).min
+_INT32_MAX = np.iinfo(np.int32).max
+
+# API 응답(output1) 중 수치형 변환이 필요한 컬럼들
+NUMERIC_COLUMNS: Tuple[str, ...] = (
+    "bstp_nmix_prpr",
+    "bstp_nmix_prdy_vrss",
+    "bstp_nmix_prdy_ctrt",
+    "bstp_nmix_oprc",
+    "bstp_nmix_hgpr",
+    "bstp_nmix_lwpr",
+    "stck_prdy_clpr",
+    "frgn_ntby_qty",
+    "frgn_reg_ntby_qty",
+    "frgn_nreg_ntby_qty",
+    "prsn_ntby_qty",
+    "orgn_ntby_qty",
+    "scrt_ntby_qty",
+    "ivtr_ntby_qty",
+    "pe_fund_ntby_vol",
+    "bank_ntby_qty",
+    "insu_ntby_qty",
+    "mrbn_ntby_qty",
+    "fund_ntby_qty",
+    "etc_ntby_qty",
+    "etc_orgt_ntby_vol",
+    "etc_corp_ntby_vol",
+    "frgn_ntby_tr_pbmn",
+    "frgn_reg_ntby_pbmn",
+    "frgn_nreg_ntby_pbmn",
+    "prsn_ntby_tr_pbmn",
+    "orgn_ntby_tr_pbmn",
+    "scrt_ntby_tr_pbmn",
+    "ivtr_ntby_tr_pbmn",
+    "pe_fund_ntby_tr_pbmn",
+    "bank_ntby_tr_pbmn",
+    "insu_ntby_tr_pbmn",
+    "mrbn_ntby_tr_pbmn",
+    "fund_ntby_tr_pbmn",
+    "etc_ntby_tr_pbmn",
+    "etc_orgt_ntby_tr_pbmn",
+    "etc_corp_ntby_tr_pbmn",
+)
+_NUMERIC_COLUMN_SET = frozenset(NUMERIC_COLUMNS)
+
+# 정수형으로 축소하는 순매수 수량/거래대금 컬럼
+_INTEGER_COLUMN_SET = frozenset(
+    col for col in NUMERIC_COLUMNS if col.endswith(("_qty", "_vol", "_pbmn"))
+)
+
 
 class InvestorDaily(Feature):
     """
@@ -30,6 +85,12 @@ class InvestorDaily(Feature):
     - `call_feature` 메서드를 통해 저장된 데이터를 반환합니다.
     """
 
+    # 컬럼 단위로 DataFrame을 구성할 때 사용하는 응답 컬럼 (순서 고정)
+    _known_columns: Tuple[str, ...] = (
+        "stck_bsop_date",
+        "market_code",
+    ) + NUMERIC_COLUMNS
+
     def __init__(
         self,
         _feature_name: str,
@@ -74,6 +135,29 @@ class InvestorDaily(Feature):
         self.end_date = self.params.get("end_date", "20251231")
         self.pagination_delay_sec = self.params.get("pagination_delay_sec", 1.0)
 
+        # API 호출 속도 제한 (허용 요청 수 내에서는 대기 없이 연속 호출,
+        # 오류 발생 시 RateLimiter가 적응형 지연을 늘림)
+        # - requests_per_second를 지정하면 초당 해당 횟수까지 허용
+        # - 지정하지 않으면 pagination_delay_sec마다 1회 (기존 호출 간격과 같은 상한)
+        # - 둘 다 없거나 지연이 0이면 속도 제한 없음
+        self.requests_per_second = self.params.get("requests_per_second")
+        if self.requests_per_second:
+            self._rate_limiter = RateLimiter(
+                max_requests=self.requests_per_second, per_seconds=1
+            )
+        elif self.pagination_delay_sec:
+            self._rate_limiter = RateLimiter(
+                max_requests=1, per_seconds=self.pagination_delay_sec
+            )
+        else:
+            self._rate_limiter = None
+        self.output_dir = self.params.get("output_dir", "data")
+
+        # API 응답 디스크 캐시 설정 (확정된 과거 일자만 재사용)
+        self.cache_dir = self.params.get("cache_dir", ".cache/investor_daily")
+        self.settle_days = self.params.get("settle_days", 2)
+        self.force_refresh = self.params.get("force_refresh", False)
+
         # 시장별 매핑 정보 설정
         self.market_mappings = self.params.get(
             "market_mappings",
@@ -111,15 +195,82 @@ class InvestorDaily(Feature):
 
         return dates
 
+    def _get_cache_path(self, market_code: str, target_date: str) -> str:
+        """(시장, 날짜)별 API 응답 캐시 파일 경로 반환"""
+        return os.path.join(self.cache_dir, market_code, f"{target_date}.json")
+
+    def _is_settled_date(self, target_date: str) -> bool:
+        """오늘 기준 `settle_days` 영업일(주말 제외) 이전 날짜인지 확인
+
+        확정된 과거 일자의 응답만 캐시에서 재사용하고, 최근 일자는 정정 가능성이
+        있으므로 항상 새로 조회합니다.
+        """
+        cutoff_dt = datetime.now()
+        remaining = self.settle_days
+        while remaining > 0:
+            cutoff_dt -= timedelta(days=1)
+            if cutoff_dt.weekday() < 5:
+                remaining -= 1
+
+        return target_date < cutoff_dt.strftime("%Y%m%d")
+
+    def _load_cached_response(
+        self, market_code: str, target_date: str
+    ) -> Optional[List[Dict]]:
+        """캐시된 API 응답 로드 (없거나 재사용 불가 시 None)"""
+        if self.force_refresh or not self._is_settled_date(target_date):
+            return None
+
+        cache_path = self._get_cache_path(market_code, target_date)
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"캐시 파일 로드 실패, API로 재조회: {cache_path} - {e}")
+            return None
+
+    def _save_cached_response(
+        self, market_code: str, target_date: str, records: List[Dict]
+    ):
+        """API 응답을 캐시 파일로 저장 (임시 파일 작성 후 교체하여 원자적으로 기록)"""
+        cache_path = self._get_cache_path(market_code, target_date)
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(records, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+
+        except Exception as e:
+            logger.warning(f"캐시 파일 저장 실패: {cache_path} - {e}")
+
     def _call_daily_investor_api(
         self, market_code: str, target_date: str
     ) -> Optional[Dict]:
-        """시장별 투자자매매동향(일별) API 호출"""
+        """시장별 투자자매매동향(일별) API 호출
+
+        확정된 과거 일자는 디스크 캐시(`cache_dir/{market}/{date}.json`)가 있으면
+        API를 호출하지 않고 캐시된 응답을 반환합니다.
+        """
         try:
             if market_code not in self.market_mappings:
                 logger.error(f"지원하지 않는 시장 코드: {market_code}")
                 return None
 
+            cached = self._load_cached_response(market_code, target_date)
+            if cached is not None:
+                logger.debug(f"캐시된 응답 사용: {market_code}, {target_date}")
+                return cached
+
             mapping = self.market_mappings[market_code]
 
             # API 파라미터 구성
@@ -135,6 +286,9 @@ class InvestorDaily(Feature):
             logger.debug(f"일별 투자자매매동향 API 호출: {market_code}, {target_date}")
             logger.debug(f"파라미터: {params}")
 
+            # 실제 API 호출 직전에만 속도 제한 적용 (캐시 적중 시에는 대기 없음)
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
             response = self._feature_query.call_api(
                 path="/uapi/domestic-stock/v1/quotations/inquire-investor-daily-by-market",
                 method="GET",
@@ -143,8 +297,14 @@ class InvestorDaily(Feature):
             )
 
             if response and response.get("rt_cd") == "0":
-                return response.get("output1", [])
+                if self._rate_limiter is not None:
+                    self._rate_limiter.report_success()
+                records = response.get("output1", [])
+                self._save_cached_response(market_code, target_date, records)
+                return records
             else:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.report_error()
                 error_msg = (
                     response.get("msg1", "Unknown error") if response else "No response"
                 )
@@ -154,82 +314,88 @@ class InvestorDaily(Feature):
                 return None
 
         except Exception as e:
+            # HTTP 429 등 요청 실패 시 이후 호출 간격을 늘림
+            if self._rate_limiter is not None:
+                self._rate_limiter.report_error()
             logger.error(f"일별 투자자매매동향 API 호출 중 오류: {e}")
             logger.error(traceback.format_exc())
             return None
 
-    def _process_daily_investor_data(
-        self, raw_data: List[Dict], market_code: str
-    ) -> pd.DataFrame:
-        """API 응답 데이터를 DataFrame으로 변환"""
+    def _process_daily_investor_data(self, raw_data: List[Dict]) -> pd.DataFrame:
+        """수집 기간 전체의 API 응답 레코드를 하나의 DataFrame으로 변환
+
+        일자별로 작은 DataFrame을 만들어 합치는 대신, 원시 레코드를 모두 모은 뒤
+        한 번에 변환하여 날짜 파싱과 수치형 변환을 전체 컬럼에 대해 한 번만 수행합니다.
+
+        Args:
+            raw_data (List[Dict]): `market_code`가 태깅된 API 응답 레코드 리스트
+
+        Returns:
+            pd.DataFrame: 거래일 기준으로 정렬된 일별 투자자매매동향 데이터
+        """
         if not raw_data:
             return pd.DataFrame()
 
         try:
-            # DataFrame 생성
-            df = pd.DataFrame(raw_data)
+            # 레코드를 컬럼 단위 리스트로 전치한 뒤 DataFrame 생성
+            # (응답에 없는 컬럼은 None으로 채워지고, 정의되지 않은 필드도 보존)
+            known_columns = self._known_columns
+            extra_columns = [key for key in raw_data[0] if key not in known_columns]
+            columns = {
+                key: [row.get(key) for row in raw_data]
+                for key in known_columns + tuple(extra_columns)
+            }
+            df = pd.DataFrame(columns, copy=False)
 
-            # 날짜 컬럼 처리
+            # 날짜 컬럼 처리 (반복되는 일자 문자열은 한 번만 파싱)
             if "stck_bsop_date" in df.columns:
-                df["trade_date"] = pd.to_datetime(df["stck_bsop_date"], format="%Y%m%d")
+                df["trade_date"] = pd.to_datetime(
+                    df["stck_bsop_date"], format="%Y%m%d", cache=True
+                )
                 df = df.drop("stck_bsop_date", axis=1)
 
-            # 시장 코드 추가
-            df["market_code"] = market_code
-
-            # 수치형 변환이 필요한 컬럼들
-            numeric_columns = [
-                "bstp_nmix_prpr",
-                "bstp_nmix_prdy_vrss",
-                "bstp_nmix_prdy_ctrt",
-                "bstp_nmix_oprc",
-                "bstp_nmix_hgpr",
-                "bstp_nmix_lwpr",
-                "stck_prdy_clpr",
-                "frgn_ntby_qty",
-                "frgn_reg_ntby_qty",
-                "frgn_nreg_ntby_qty",
-                "prsn_ntby_qty",
-                "orgn_ntby_qty",
-                "scrt_ntby_qty",
-                "ivtr_ntby_qty",
-                "pe_fund_ntby_vol",
-                "bank_ntby_qty",
-                "insu_ntby_qty",
-                "mrbn_ntby_qty",
-                "fund_ntby_qty",
-                "etc_ntby_qty",
-                "etc_orgt_ntby_vol",
-                "etc_corp_ntby_vol",
-                "frgn_ntby_tr_pbmn",
-                "frgn_reg_ntby_pbmn",
-                "frgn_nreg_ntby_pbmn",
-                "prsn_ntby_tr_pbmn",
-                "orgn_ntby_tr_pbmn",
-                "scrt_ntby_tr_pbmn",
-                "ivtr_ntby_tr_pbmn",
-                "pe_fund_ntby_tr_pbmn",
-                "bank_ntby_tr_pbmn",
-                "insu_ntby_tr_pbmn",
-                "mrbn_ntby_tr_pbmn",
-                "fund_ntby_tr_pbmn",
-                "etc_ntby_tr_pbmn",
-                "etc_orgt_ntby_tr_pbmn",
-                "etc_corp_ntby_tr_pbmn",
-            ]
-
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
+            # 수치형 컬럼을 한 번에 변환한 뒤 더 작은 dtype으로 축소
+            # - 순매수 수량/거래대금(_qty, _vol, _pbmn): 결측이 없고 int32 범위 안이면 int32,
+            #   결측이 없지만 범위를 벗어나면 int64, 결측이 있으면 float32
+            # - 지수/등락률 등 나머지: float32
+            present = [col for col in df.columns if col in _NUMERIC_COLUMN_SET]
+            if present:
+                df[present] = df[present].apply(pd.to_numeric, errors="coerce")
+
+                int_cols = [col for col in present if col in _INTEGER_COLUMN_SET]
+                float_cols = [col for col in present if col not in _INTEGER_COLUMN_SET]
+                if float_cols:
+                    df[float_cols] = df[float_cols].astype("float32")
+                if int_cols:
+                    int_frame = df[int_cols]
+                    complete = int_frame.notna().all()
+                    fits = (
+                        complete
+                        & (int_frame.min() >= _INT32_MIN)
+                        & (int_frame.max() <= _INT32_MAX)
+                    )
+                    int32_cols = fits.index[fits].tolist()
+                    int64_cols = fits.index[complete & ~fits].tolist()
+                    nan_cols = complete.index[~complete].tolist()
+                    if int32_cols:
+                        df[int32_cols] = int_frame[int32_cols].astype("int32")
+                    if int64_cols:
+                        df[int64_cols] = int_frame[int64_cols].astype("int64")
+                    if nan_cols:
+                        df[nan_cols] = int_frame[nan_cols].astype("float32")
 
             # 컬럼 순서 정리
-            base_columns = ["trade_date", "market_code"]
+            base_columns = [
+                col for col in ("trade_date", "market_code") if col in df.columns
+            ]
             other_columns = [col for col in df.columns if col not in base_columns]
             df = df[base_columns + other_columns]
 
-            logger.info(
-                f"일별 투자자매매동향 데이터 처리 완료: {market_code}, {len(df)}건"
-            )
+            # 날짜순 정렬
+            if "trade_date" in df.columns:
+                df = df.sort_values("trade_date").reset_index(drop=True)
+
+            logger.info(f"일별 투자자매매동향 데이터 처리 완료: {len(df)}건")
             return df
 
         except Exception as e:
@@ -249,30 +415,21 @@ class InvestorDaily(Feature):
             for market_code in self.code_list:
                 logger.info(f"시장 {market_code} 데이터 수집 시작")
 
-                market_data_list = []
+                # 원시 레코드를 모아 두었다가 시장별로 한 번에 변환
+                market_rows: List[Dict] = []
 
                 for target_date in date_list:
                     # API 호출
                     raw_data = self._call_daily_investor_api(market_code, target_date)
 
                     if raw_data:
-                        # 데이터 처리
-                        processed_data = self._process_daily_investor_data(
-                            raw_data, market_code
+                        market_rows.extend(
+                            {**row, "market_code": market_code} for row in raw_data
                         )
-                        if not processed_data.empty:
-                            market_data_list.append(processed_data)
-
-                    # API 호출 간격 조절
-                    time.sleep(self.pagination_delay_sec)
 
                 # 시장별 데이터 통합
-                if market_data_list:
-                    combined_df = pd.concat(market_data_list, ignore_index=True)
-                    combined_df = combined_df.sort_values("trade_date").reset_index(
-                        drop=True
-                    )
-
+                combined_df = self._process_daily_investor_data(market_rows)
+                if not combined_df.empty:
                     # 데이터 저장
                     self.daily_investor_data[market_code] = combined_df
 
@@ -289,25 +446,92 @@ class InvestorDaily(Feature):
             logger.error(f"일별 투자자매매동향 데이터 수집 중 오류 발생: {e}")
             logger.error(traceback.format_exc())
 
-    def call_feature(self, code: str) -> Optional[pd.DataFrame]:
+    def _get_parquet_path(self, market_code: str) -> str:
+        """시장별 Parquet 파일 경로 반환"""
+        return os.path.join(
+            self.output_dir, self.schema_name, self.feature_name, f"{market_code}.parquet"
+        )
+
+    def save_data_to_file(self, df: pd.DataFrame, market_code: str) -> Optional[str]:
+        """시장별 일별 투자자매매동향 데이터를 Parquet(Snappy) 파일로 저장
+
+        컬럼 dtype 정보가 함께 보존되므로 다시 읽을 때 날짜/수치형 변환이 필요 없습니다.
+
+        Args:
+            df (pd.DataFrame): 저장할 데이터
+            market_code (str): 시장 코드 (kospi, kosdaq)
+
+        Returns:
+            Optional[str]: 저장된 파일 경로 (실패 시 None)
+        """
+        try:
+            file_path = self._get_parquet_path(market_code)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            df.to_parquet(file_path, engine="pyarrow", compression="snappy", index=False)
+            logger.info(f"Parquet 파일 저장 완료: {file_path} ({len(df)}건)")
+            return file_path
+
+        except Exception as e:
+            logger.error(f"Parquet 파일 저장 중 오류: {market_code} - {e}")
+            logger.error(traceback.format_exc())
+            return None
+
+    def load_data_from_file(self, market_code: str) -> Optional[pd.DataFrame]:
+        """저장된 Parquet 파일에서 시장별 데이터를 읽어 저장소에 적재
+
+        Args:
+            market_code (str): 시장 코드 (kospi, kosdaq)
+
+        Returns:
+            Optional[pd.DataFrame]: 읽어온 데이터 (파일이 없거나 실패 시 None)
+        """
+        file_path = self._get_parquet_path(market_code)
+        if not os.path.exists(file_path):
+            logger.warning(f"Parquet 파일이 없습니다: {file_path}")
+            return None
+
+        try:
+            df = pd.read_parquet(file_path, engine="pyarrow")
+            self.daily_investor_data[market_code] = df
+            logger.info(f"Parquet 파일 로드 완료: {file_path} ({len(df)}건)")
+            return df
+
+        except Exception as e:
+            logger.error(f"Parquet 파일 로드 중 오류: {file_path} - {e}")
+            logger.error(traceback.format_exc())
+            return None
+
+    def call_feature(self, code: str, copy: bool = False) -> Optional[pd.DataFrame]:
         """지정된 시장의 일별 투자자매매동향 데이터 반환
 
+        기본적으로 저장된 DataFrame을 복사 없이 반환합니다. 반환값을 직접 수정하는
+        호출자는 `copy=True`로 사본을 받아야 합니다.
+
         Args:
             code (str): 시장 코드 (kospi, kosdaq)
+            copy (bool): True이면 사본을 반환
 
         Returns:
             Optional[pd.DataFrame]: 해당 시장의 일별 투자자매매동향 데이터
         """
         if code in self.daily_investor_data:
-            return self.daily_investor_data[code].copy()
+            df = self.daily_investor_data[code]
+            return df.copy() if copy else df
 
         logger.warning(f"시장 코드 '{code}'에 대한 데이터가 없습니다.")
         return None
 
-    def get_all_data(self) -> Dict[str, pd.DataFrame]:
+    def get_all_data(self, copy: bool = False) -> Dict[str, pd.DataFrame]:
         """모든 시장의 일별 투자자매매동향 데이터 반환
 
+        Args:
+            copy (bool): True이면 각 DataFrame의 사본을 반환
+
         Returns:
             Dict[str, pd.DataFrame]: 시장별 일별 투자자매매동향 데이터
         """
-        return {market: df.copy() for market, df in self.daily_investor_data.items()}
+        if copy:
+            return {
+                market: df.copy() for market, df in self.daily_investor_data.items()
+            }
+        return dict(self.daily_investor_data)
@@ -8,28 +8,84 @@
 """
 
 import os
+import re
 import sys
-import yaml
+import atexit
 import logging
+import logging.handlers
+import queue
 import argparse
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time as _time
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 import pandas as pd
-import traceback
-
-# 로깅 설정 - WARNING 레벨로 변경하여 중요한 정보만 출력
-current_date = datetime.now().strftime("%Y%m%d")
-log_file = f"logs/data_collector_{current_date}.log"
-os.makedirs(os.path.dirname(log_file), exist_ok=True)
-
-logging.basicConfig(
-    level=logging.WARNING,  # INFO에서 WARNING으로 변경
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_file, encoding="utf-8"),
-        logging.StreamHandler(),
-    ],
-)
+
+
+def _now_hms() -> str:
+    """현재 시각을 HHMMSS 형식으로 반환"""
+    return _time.strftime("%H%M%S")
+
+
+def _now_hms_colon() -> str:
+    """현재 시각을 HH:MM:SS 형식으로 반환"""
+    return _time.strftime("%H:%M:%S")
+
+
+# 한 번의 수집 실행에서 동시에 파일 I/O를 수행하는 최대 스레드 수
+_MAX_IO_WORKERS = 16
+
+# 이미 생성한 디렉토리 (같은 경로에 대한 반복 makedirs 호출 방지)
+_MADE_DIRS = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """디렉토리가 없으면 생성 (프로세스 내에서 경로당 한 번만 확인)"""
+    if path not in _MADE_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _MADE_DIRS.add(path)
+
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _setup_logging() -> None:
+    """로그 파일/콘솔 핸들러와 백그라운드 리스너 스레드 설정 (스크립트 실행 시 한 번만)
+
+    로그 기록은 큐를 통해 백그라운드 리스너 스레드에서 처리합니다
+    (작업 스레드가 파일 I/O로 대기하지 않음).
+    모듈을 임포트만 하는 경우에는 파일 핸들러나 스레드를 만들지 않도록 main()에서 호출합니다.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    # 로깅 설정 - WARNING 레벨로 변경하여 중요한 정보만 출력
+    current_date = _time.strftime("%Y%m%d")
+    log_file = f"logs/data_collector_{current_date}.log"
+    _ensure_dir(os.path.dirname(log_file))
+
+    log_formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(log_formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(log_formatter)
+
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+
+    logging.basicConfig(
+        level=logging.WARNING,  # INFO에서 WARNING으로 변경
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        format="%(message)s",  # 최종 포맷은 리스너 쪽 핸들러에서 적용
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
 logger = logging.getLogger(__name__)
 
 # 경로 설정
@@ -39,11 +95,9 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 # 필요한 모듈 임포트 (DB 관련 제거)
-from src.feature_engineering.feature_manager import FeatureManager
-from src.utils.trading_calendar import (
-    get_current_trading_date,
-    get_trading_session_info,
-)
+# FeatureManager는 피처/API 모듈 전체를 불러오므로 실제 수집 시점에 임포트
+from src.utils.config_loader import load_yaml
+from src.utils.trading_calendar import get_current_trading_date
 
 
 def parse_args():
@@ -65,7 +119,7 @@ def parse_args():
         "-t",
         type=str,
         help="수집 시간 (HHMMSS 형식, 기본값: 현재 시간)",
-        default=datetime.now().strftime("%H%M%S"),
+        default=_now_hms(),
     )
 
     parser.add_argument(
@@ -108,9 +162,32 @@ def parse_args():
         default="data",
     )
 
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=["csv", "parquet", "both"],
+        help="저장 파일 형식 (기본값: csv)",
+        default="csv",
+    )
+
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="CSV 파일을 다시 쓰지 않고 새 행만 추가 (중복 제거 생략)",
+    )
+
     return parser.parse_args()
 
 
+# 피처 이름 패턴별 스키마 (위에서부터 순서대로 적용, 투자자 매매동향 우선)
+_SCHEMA_RULES = (
+    (re.compile(r"investor"), "market_data"),
+    (re.compile(r"options"), "domestic_options"),
+    (re.compile(r"overseas.*futures|futures.*overseas"), "overseas_futures"),
+    (re.compile(r"futures"), "domestic_futures"),
+)
+
+
 def get_schema_name(feature_name: str) -> str:
     """피처 이름에서 스키마 이름 결정
 
@@ -120,17 +197,89 @@ def get_schema_name(feature_name: str) -> str:
     Returns:
         스키마 이름
     """
-    # 투자자 매매동향 데이터는 우선순위 높게 처리
-    if "investor" in feature_name:
-        return "market_data"
-    elif "options" in feature_name:
-        return "domestic_options"
-    elif "futures" in feature_name and "overseas" in feature_name:
-        return "overseas_futures"
-    elif "futures" in feature_name:
-        return "domestic_futures"
-    else:
-        return "sushi"
+    for pattern, schema_name in _SCHEMA_RULES:
+        if pattern.search(feature_name):
+            return schema_name
+    return "sushi"
+
+
+# 투자자 매매동향 필수 컬럼 (외국인, 기관 데이터만)
+_INVESTOR_COLS = (
+    # 외국인 데이터
+    "frgn_seln_vol",
+    "frgn_shnu_vol",
+    "frgn_ntby_qty",
+    "frgn_seln_tr_pbmn",
+    "frgn_shnu_tr_pbmn",
+    "frgn_ntby_tr_pbmn",
+    # 기관 데이터
+    "orgn_seln_vol",
+    "orgn_shnu_vol",
+    "orgn_ntby_qty",
+    "orgn_seln_tr_pbmn",
+    "orgn_shnu_tr_pbmn",
+    "orgn_ntby_tr_pbmn",
+)
+
+_INVESTOR_NUMERIC = frozenset(_INVESTOR_COLS)
+
+# 메타데이터 컬럼들
+_META_COLS = ("code", "trade_date", "collection_time")
+
+# 필터링 결과 컬럼 순서
+_INVESTOR_ORDER = _INVESTOR_COLS + _META_COLS
+_INVESTOR_KEEP = frozenset(_INVESTOR_ORDER)
+
+
+def _iter_code_data(
+    data: Any,
+) -> Iterator[Tuple[Optional[str], Union[List[Dict[str, Any]], pd.DataFrame]]]:
+    """피처 데이터에서 비어 있지 않은 코드별 데이터를 순회
+
+    - 코드별 딕셔너리: API 응답이면 `output2` 레코드 리스트, DataFrame이면 그대로 반환
+    - 단일 DataFrame: 코드 없이(None) 한 번 반환
+    - None/빈 응답(장 마감 후 등)은 변환 없이 건너뜀
+
+    Args:
+        data: 피처 데이터
+
+    Yields:
+        (코드, 레코드 리스트 또는 DataFrame)
+    """
+    if isinstance(data, pd.DataFrame):
+        if not data.empty:
+            yield None, data
+        return
+
+    if not isinstance(data, dict):
+        return
+
+    for code, code_data in data.items():
+        if isinstance(code_data, dict):
+            output2 = code_data.get("output2")
+            if output2:
+                yield code, output2
+        elif isinstance(code_data, pd.DataFrame) and not code_data.empty:
+            yield code, code_data
+
+
+def _iter_code_frames(
+    data: Any, is_investor: bool = False
+) -> Iterator[Tuple[Optional[str], pd.DataFrame]]:
+    """코드별 데이터를 DataFrame으로 변환하며 순회 (필요할 때마다 하나씩 생성)
+
+    Args:
+        data: 피처 데이터
+        is_investor: 투자자 매매동향 데이터 여부
+
+    Yields:
+        (코드, DataFrame) - 단일 DataFrame 입력이면 코드는 None
+    """
+    for code, payload in _iter_code_data(data):
+        if isinstance(payload, pd.DataFrame):
+            yield code, payload
+        else:
+            yield code, _records_to_frame(payload, is_investor)
 
 
 def combine_codes_data(data: Dict[str, Any]) -> pd.DataFrame:
@@ -142,29 +291,24 @@ def combine_codes_data(data: Dict[str, Any]) -> pd.DataFrame:
     Returns:
         통합된 DataFrame
     """
-    combined_data = []
-
-    for code, code_data in data.items():
-        if code_data is None:
-            continue
-
-        # API 응답에서 DataFrame 추출
-        if isinstance(code_data, dict) and "output2" in code_data:
-            df = pd.DataFrame(code_data["output2"])
-        elif isinstance(code_data, pd.DataFrame):
-            df = code_data
+    # API 응답 레코드는 코드 태깅만 하여 모아 두고 마지막에 한 번에 변환
+    records: List[Dict[str, Any]] = []
+    frames: List[pd.DataFrame] = []
+
+    for code, payload in _iter_code_data(data):
+        if isinstance(payload, pd.DataFrame):
+            # 원본 DataFrame을 수정하지 않도록 assign으로 코드 컬럼 추가
+            frames.append(payload.assign(code=code))
         else:
-            continue
-
-        if df.empty:
-            continue
+            records.extend({**row, "code": code} for row in payload)
 
-        # 코드 컬럼 추가
-        df["code"] = code
-        combined_data.append(df)
+    parts = []
+    if records:
+        parts.append(pd.DataFrame.from_records(records))
+    parts.extend(frames)
 
-    if combined_data:
-        return pd.concat(combined_data, ignore_index=True)
+    if parts:
+        return pd.concat(parts, ignore_index=True)
     else:
         return pd.DataFrame()
 
@@ -178,38 +322,59 @@ def filter_investor_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         필터링된 DataFrame
     """
-    # 필요한 컬럼 정의 (외국인, 기관 데이터만)
-    essential_columns = [
-        # 외국인 데이터
-        "frgn_seln_vol",
-        "frgn_shnu_vol",
-        "frgn_ntby_qty",
-        "frgn_seln_tr_pbmn",
-        "frgn_shnu_tr_pbmn",
-        "frgn_ntby_tr_pbmn",
-        # 기관 데이터
-        "orgn_seln_vol",
-        "orgn_shnu_vol",
-        "orgn_ntby_qty",
-        "orgn_seln_tr_pbmn",
-        "orgn_shnu_tr_pbmn",
-        "orgn_ntby_tr_pbmn",
-    ]
-
-    # 메타데이터 컬럼들
-    meta_columns = ["code", "trade_date", "collection_time"]
-
-    # 존재하는 컬럼만 선택
-    available_columns = []
-    for col in essential_columns:
-        if col in df.columns:
-            available_columns.append(col)
-
-    for col in meta_columns:
-        if col in df.columns:
-            available_columns.append(col)
-
-    return df[available_columns]
+    present = set(df.columns)
+
+    # 이미 필요한 컬럼만 있으면 (필수 컬럼으로 생성된 경우) 그대로 반환
+    if present <= _INVESTOR_KEEP:
+        return df
+
+    # 존재하는 컬럼만 정해진 순서대로 선택
+    return df.loc[:, [col for col in _INVESTOR_ORDER if col in present]]
+
+
+def downcast_numeric_columns(df: pd.DataFrame, is_investor: bool) -> pd.DataFrame:
+    """CSV 저장 전 수치형 컬럼을 가능한 작은 dtype으로 축소
+
+    투자자 매매동향 데이터는 문자열로 수신된 필수 컬럼을 정수형으로 변환하고,
+    그 외 데이터는 이미 수치형(int64/float64)인 컬럼만 축소합니다.
+
+    Args:
+        df: 저장할 DataFrame
+        is_investor: 투자자 매매동향 데이터 여부
+
+    Returns:
+        수치형 컬럼이 축소된 DataFrame
+    """
+    converted = {}
+    for col in df.columns:
+        if is_investor and col in _INVESTOR_NUMERIC:
+            converted[col] = pd.to_numeric(df[col], errors="coerce", downcast="integer")
+        elif df[col].dtype == "int64":
+            converted[col] = pd.to_numeric(df[col], downcast="integer")
+        elif df[col].dtype == "float64":
+            converted[col] = pd.to_numeric(df[col], downcast="float")
+
+    return df.assign(**converted) if converted else df
+
+
+def _records_to_frame(records: List[Dict[str, Any]], is_investor: bool) -> pd.DataFrame:
+    """API 응답 레코드 리스트를 DataFrame으로 변환
+
+    투자자 매매동향 데이터는 어차피 필수 컬럼만 남기므로, 첫 레코드에 있는
+    필수 컬럼만 지정하여 변환합니다 (레코드별 컬럼 추론 생략).
+
+    Args:
+        records: API 응답 레코드 리스트 (output2)
+        is_investor: 투자자 매매동향 데이터 여부
+
+    Returns:
+        변환된 DataFrame
+    """
+    if is_investor:
+        first = records[0]
+        columns = [col for col in _INVESTOR_COLS if col in first]
+        return pd.DataFrame.from_records(records, columns=columns, coerce_float=True)
+    return pd.DataFrame.from_records(records)
 
 
 def get_csv_filename(feature_name: str, code: str) -> str:
@@ -225,14 +390,203 @@ def get_csv_filename(feature_name: str, code: str) -> str:
     return f"{code}.csv"
 
 
-def save_feature_to_csv(
+# Excel 호환을 위한 UTF-8 BOM (기존 utf-8-sig 인코딩과 동일한 출력)
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _is_arrow_csv_compatible(arrow_type: Any) -> bool:
+    """PyArrow CSV 출력이 pandas `to_csv`와 같은 Arrow 타입인지 확인 (정수/문자열/null)"""
+    import pyarrow.types as pat
+
+    return (
+        pat.is_integer(arrow_type)
+        or pat.is_string(arrow_type)
+        or pat.is_large_string(arrow_type)
+        or pat.is_null(arrow_type)
+    )
+
+
+def _arrow_csv_bytes(
+    df: pd.DataFrame, csv_path: str, include_header: bool
+) -> Optional[bytes]:
+    """PyArrow CSV 작성기로 DataFrame을 CSV 바이트열로 변환
+
+    pandas `to_csv`와 같은 형식을 유지하기 위해 값은 따옴표 없이 기록하고,
+    헤더는 pandas로 작성합니다. PyArrow와 pandas의 출력이 같은 정수/문자열 컬럼
+    2개 이상으로 이루어진 경우만 처리합니다. 그 외 타입(실수, 날짜, bool 등 - 표기
+    형식이 다름), 따옴표가 필요한 값(쉼표, 따옴표, 줄바꿈 포함), Arrow 테이블로
+    변환할 수 없는 컬럼(혼합 타입 등)이 있으면 None을 반환합니다.
+
+    Args:
+        df: 변환할 DataFrame
+        csv_path: 로그 출력용 CSV 파일 경로
+        include_header: True이면 헤더 행 포함
+
+    Returns:
+        CSV 바이트열 (PyArrow로 변환할 수 없으면 None)
+    """
+    import pyarrow as pa  # 파일 저장 시에만 필요
+    import pyarrow.csv as pacsv
+
+    # 값은 따옴표 없이 기록 (pandas to_csv와 같은 형식). 헤더는 pandas로 따로 작성
+    write_options = pacsv.WriteOptions(include_header=False, quoting_style="none")
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # 실수(2.0 -> 2, 1e-05 -> 0.00001), 날짜(시각 포함), bool(true/false)은
+        # pandas와 표기가 달라지므로 pandas로 저장
+        # 컬럼이 하나뿐이면 pandas는 빈 값을 ""로 기록하므로 (빈 줄 방지) pandas로 저장
+        if table.num_columns < 2 or not all(
+            _is_arrow_csv_compatible(field.type) for field in table.schema
+        ):
+            logger.debug("PyArrow CSV 표기 불일치 타입 포함, pandas로 저장: %s", csv_path)
+            return None
+        # 중간에 실패해도 파일이 깨지지 않도록 메모리 버퍼에 먼저 기록
+        sink = pa.BufferOutputStream()
+        pacsv.write_csv(table, sink, write_options=write_options)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        logger.debug("PyArrow CSV 변환 불가, pandas로 저장: %s - %s", csv_path, e)
+        return None
+
+    body = sink.getvalue().to_pybytes()
+    if include_header:
+        return df.iloc[:0].to_csv(index=False).encode("utf-8") + body
+    return body
+
+
+def _write_csv_fast(df: pd.DataFrame, csv_path: str) -> None:
+    """PyArrow CSV 작성기로 DataFrame을 UTF-8(BOM 포함) CSV 파일로 저장
+
+    PyArrow로 변환할 수 없으면 pandas `to_csv`로 저장합니다.
+
+    Args:
+        df: 저장할 DataFrame
+        csv_path: CSV 파일 경로
+    """
+    data = _arrow_csv_bytes(df, csv_path, include_header=True)
+    if data is None:
+        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        return
+
+    with open(csv_path, "wb") as f:
+        f.write(_UTF8_BOM)
+        f.write(data)
+
+
+def _append_csv(df: pd.DataFrame, csv_path: str) -> None:
+    """기존 CSV 파일 끝에 새 행만 추가 (파일이 없으면 BOM과 헤더를 포함해 새로 작성)
+
+    기존 파일을 읽어 병합하지 않으므로 중복 제거는 수행하지 않으며,
+    기존 파일과 컬럼 구성이 같다고 가정합니다.
+
+    Args:
+        df: 추가할 DataFrame
+        csv_path: CSV 파일 경로
+    """
+    if not os.path.exists(csv_path):
+        _write_csv_fast(df, csv_path)
+        return
+
+    data = _arrow_csv_bytes(df, csv_path, include_header=False)
+    if data is None:
+        df.to_csv(csv_path, index=False, mode="a", header=False, encoding="utf-8")
+        return
+
+    with open(csv_path, "ab") as f:
+        f.write(data)
+
+
+def _write_parquet(df: pd.DataFrame, parquet_path: str) -> None:
+    """DataFrame을 Parquet(Snappy) 파일로 저장
+
+    Args:
+        df: 저장할 DataFrame
+        parquet_path: Parquet 파일 경로
+    """
+    import pyarrow as pa  # parquet 형식 저장 시에만 필요
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, parquet_path, compression="snappy")
+
+
+def _merge_with_existing(
+    df: pd.DataFrame, existing_df: pd.DataFrame, with_code: bool
+) -> pd.DataFrame:
+    """기존 파일 데이터와 새 데이터를 합치고 중복 제거 후 날짜순 정렬
+
+    Args:
+        df: 새로 수집한 DataFrame
+        existing_df: 기존 파일에서 읽은 DataFrame
+        with_code: True이면 날짜와 코드 기준으로 중복 제거
+
+    Returns:
+        병합된 DataFrame
+    """
+    df = pd.concat([existing_df, df], ignore_index=True)
+
+    # 중복 제거: 날짜 기준으로 중복 제거 (최신 데이터 유지)
+    date_col = None
+    if "stck_bsop_date" in df.columns:
+        date_col = "stck_bsop_date"
+    elif "trade_date" in df.columns:
+        date_col = "trade_date"
+
+    if date_col:
+        subset = [date_col, "code"] if with_code else [date_col]
+        df = df.drop_duplicates(subset=subset, keep="last")
+
+        # 날짜순 정렬
+        df = df.sort_values([date_col], ascending=True)
+
+    return df
+
+
+def _write_feature_file(
+    df: pd.DataFrame, csv_path: str, fmt: str, with_code: bool, append: bool = False
+) -> None:
+    """기존 데이터와 병합하여 지정된 형식(csv/parquet/both)으로 저장
+
+    Parquet 파일은 CSV 파일과 같은 경로에 확장자만 `.parquet`으로 바꿔 저장합니다.
+    `append`가 True이면 CSV는 기존 파일을 다시 쓰지 않고 새 행만 추가합니다.
+    (Parquet은 추가 쓰기를 지원하지 않으므로 항상 병합 후 다시 작성)
+
+    Args:
+        df: 새로 수집한 DataFrame
+        csv_path: CSV 파일 경로
+        fmt: 저장 형식 (csv, parquet, both)
+        with_code: True이면 날짜와 코드 기준으로 중복 제거
+        append: True이면 CSV에 새 행만 추가
+    """
+    if fmt in ("csv", "both") and append:
+        _append_csv(df, csv_path)
+    elif fmt in ("csv", "both"):
+        csv_df = df
+        # 기존 파일이 있으면 읽어와서 합치기 (중복 제거)
+        if os.path.exists(csv_path):
+            csv_df = _merge_with_existing(df, pd.read_csv(csv_path), with_code)
+        _write_csv_fast(csv_df, csv_path)
+
+    if fmt in ("parquet", "both"):
+        parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+        parquet_df = df
+        if os.path.exists(parquet_path):
+            parquet_df = _merge_with_existing(
+                df, pd.read_parquet(parquet_path), with_code
+            )
+        _write_parquet(parquet_df, parquet_path)
+
+
+def save_feature(
     feature_name: str,
     data: Any,
     start_date: str,
     end_date: str,
     output_dir: str = "data",
+    fmt: str = "csv",
+    append: bool = False,
+    max_workers: int = 8,
 ) -> bool:
-    """피처 데이터를 CSV로 저장 (코드별로 분리 저장)
+    """피처 데이터를 CSV/Parquet 파일로 저장 (코드별로 분리 저장)
 
     Args:
         feature_name: 피처 이름
@@ -240,6 +594,9 @@ def save_feature_to_csv(
         start_date: 시작 날짜 (YYYYMMDD)
         end_date: 종료 날짜 (YYYYMMDD)
         output_dir: 출력 디렉토리
+        fmt: 저장 형식 (csv, parquet, both)
+        append: True이면 CSV 파일에 새 행만 추가
+        max_workers: 코드별 파일 쓰기 스레드 수 (1 이하이면 현재 스레드에서 순차 저장)
 
     Returns:
         저장 성공 여부
@@ -248,106 +605,60 @@ def save_feature_to_csv(
         # 스키마와 피처별 폴더 생성
         schema_name = get_schema_name(feature_name)
         feature_dir = os.path.join(output_dir, schema_name, feature_name)
-        os.makedirs(feature_dir, exist_ok=True)
+        _ensure_dir(feature_dir)
+
+        # 거래일자 및 수집 시간은 저장 호출당 한 번만 계산하여 모든 코드에 공통 적용
+        trade_date = get_current_trading_date()
+        collection_time = _now_hms_colon()
+        is_investor = "investor" in feature_name
 
         saved_files = []
 
-        if isinstance(data, dict):
-            # 코드별로 개별 CSV 파일 저장
-            for code, code_data in data.items():
-                if code_data is None:
-                    continue
-
-                # API 응답에서 DataFrame 추출
-                if isinstance(code_data, dict) and "output2" in code_data:
-                    df = pd.DataFrame(code_data["output2"])
-                elif isinstance(code_data, pd.DataFrame):
-                    df = code_data
+        # 코드별 DataFrame을 하나씩 만들어 바로 쓰기 작업으로 넘김
+        # (병합/쓰기는 스레드 풀에서 동시에 처리하여 디스크 I/O 중첩.
+        #  이미 작업 스레드 안에서 호출되어 할당된 스레드가 1개면 순차 저장)
+        executor = ThreadPoolExecutor(max_workers) if max_workers > 1 else None
+        try:
+            futures = []
+            for code, df in _iter_code_frames(data, is_investor):
+                if code is None:
+                    # 단일 DataFrame인 경우: 거래일자 및 수집 시간 정보만 추가
+                    df = df.assign(
+                        trade_date=trade_date, collection_time=collection_time
+                    )
+                    csv_filename = f"{feature_name}.csv"
                 else:
-                    continue
-
-                if df.empty:
-                    continue
-
-                # 코드 컬럼 추가
-                df["code"] = code
-
-                # 거래일자 및 수집 시간 정보 추가
-                current_time = datetime.now()
-                df["trade_date"] = get_current_trading_date()
-                df["collection_time"] = current_time.strftime("%H:%M:%S")
+                    # 코드, 거래일자, 수집 시간 컬럼을 한 번에 추가 (원본 DataFrame은 유지)
+                    df = df.assign(
+                        code=code,
+                        trade_date=trade_date,
+                        collection_time=collection_time,
+                    )
+                    # CSV 파일명 생성 (콜옵션 특별 처리)
+                    csv_filename = get_csv_filename(feature_name, code)
 
                 # 투자자 매매동향 데이터인 경우 필터링 적용
-                if "investor" in feature_name:
+                if is_investor:
                     df = filter_investor_data(df)
 
-                # CSV 파일명 생성 (콜옵션 특별 처리)
-                csv_filename = get_csv_filename(feature_name, code)
-                csv_path = os.path.join(feature_dir, csv_filename)
-
-                # 기존 파일이 있으면 읽어와서 합치기 (중복 제거)
-                if os.path.exists(csv_path):
-                    existing_df = pd.read_csv(csv_path)
-                    df = pd.concat([existing_df, df], ignore_index=True)
-
-                    # 중복 제거: 날짜 기준으로 중복 제거 (최신 데이터 유지)
-                    if "stck_bsop_date" in df.columns:
-                        df = df.drop_duplicates(
-                            subset=["stck_bsop_date", "code"], keep="last"
-                        )
-                    elif "trade_date" in df.columns:
-                        df = df.drop_duplicates(
-                            subset=["trade_date", "code"], keep="last"
-                        )
-
-                    # 날짜순 정렬
-                    if "stck_bsop_date" in df.columns:
-                        df = df.sort_values(["stck_bsop_date"], ascending=True)
-                    elif "trade_date" in df.columns:
-                        df = df.sort_values(["trade_date"], ascending=True)
-
-                # CSV 저장
-                df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-                saved_files.append(csv_filename)
-
-        elif isinstance(data, pd.DataFrame):
-            # 단일 DataFrame인 경우
-            if not data.empty:
-                # 거래일자 및 수집 시간 정보 추가
-                current_time = datetime.now()
-                data["trade_date"] = get_current_trading_date()
-                data["collection_time"] = current_time.strftime("%H:%M:%S")
+                # 수치형 컬럼 축소 (직렬화량 감소)
+                df = downcast_numeric_columns(df, is_investor)
 
-                # 투자자 매매동향 데이터인 경우 필터링 적용
-                if "investor" in feature_name:
-                    data = filter_investor_data(data)
-
-                csv_filename = f"{feature_name}.csv"
                 csv_path = os.path.join(feature_dir, csv_filename)
-
-                # 기존 파일이 있으면 읽어와서 합치기 (중복 제거)
-                if os.path.exists(csv_path):
-                    existing_df = pd.read_csv(csv_path)
-                    data = pd.concat([existing_df, data], ignore_index=True)
-
-                    # 중복 제거: 날짜 기준으로 중복 제거 (최신 데이터 유지)
-                    if "stck_bsop_date" in data.columns:
-                        data = data.drop_duplicates(
-                            subset=["stck_bsop_date"], keep="last"
-                        )
-                    elif "trade_date" in data.columns:
-                        data = data.drop_duplicates(subset=["trade_date"], keep="last")
-
-                    # 날짜순 정렬
-                    if "stck_bsop_date" in data.columns:
-                        data = data.sort_values(["stck_bsop_date"], ascending=True)
-                    elif "trade_date" in data.columns:
-                        data = data.sort_values(["trade_date"], ascending=True)
-
-                # CSV 저장
-                data.to_csv(csv_path, index=False, encoding="utf-8-sig")
+                write_args = (df, csv_path, fmt, code is not None, append)
+                if executor is None:
+                    _write_feature_file(*write_args)
+                else:
+                    futures.append(executor.submit(_write_feature_file, *write_args))
                 saved_files.append(csv_filename)
 
+            # 쓰기 중 발생한 예외는 그대로 전파
+            for future in futures:
+                future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
         if saved_files:
             logger.warning(
                 f"✅ {feature_name}: {len(saved_files)}개 파일 저장 완료 ({', '.join(saved_files[:3])}{'...' if len(saved_files) > 3 else ''})"
@@ -358,7 +669,107 @@ def save_feature_to_csv(
             return False
 
     except Exception as e:
-        logger.error(f"❌ {feature_name} CSV 저장 중 오류: {str(e)}")
+        logger.error(
+            "❌ %s 파일 저장 중 오류: %s",
+            feature_name,
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        return False
+
+
+def save_feature_to_csv(
+    feature_name: str,
+    data: Any,
+    start_date: str,
+    end_date: str,
+    output_dir: str = "data",
+    append: bool = False,
+) -> bool:
+    """피처 데이터를 CSV로 저장 (코드별로 분리 저장, 기존 호출부 호환용)
+
+    Args:
+        feature_name: 피처 이름
+        data: 피처 데이터
+        start_date: 시작 날짜 (YYYYMMDD)
+        end_date: 종료 날짜 (YYYYMMDD)
+        output_dir: 출력 디렉토리
+        append: True이면 CSV 파일에 새 행만 추가
+
+    Returns:
+        저장 성공 여부
+    """
+    return save_feature(
+        feature_name, data, start_date, end_date, output_dir, fmt="csv", append=append
+    )
+
+
+def _process_one(
+    feature_name: str,
+    feature: Any,
+    date_range: Tuple[str, str],
+    output_dir: str,
+    test_mode: bool,
+    fmt: str = "csv",
+    append: bool = False,
+    write_workers: int = 1,
+) -> Optional[bool]:
+    """단일 피처의 데이터 조회 및 CSV 저장 (스레드 풀 작업 단위)
+
+    Args:
+        feature_name: 피처 이름
+        feature: 피처 객체
+        date_range: 피처별 (시작 날짜, 종료 날짜)
+        output_dir: CSV 파일 저장 디렉토리
+        test_mode: True이면 테스트 모드 (CSV 저장 없음)
+        fmt: 저장 형식 (csv, parquet, both)
+        append: True이면 CSV 파일에 새 행만 추가
+        write_workers: 이 피처에 할당된 파일 쓰기 스레드 수
+
+    Returns:
+        저장 성공 시 True, 실패 시 False, 테스트 모드 확인만 한 경우 None
+    """
+    try:
+        start_date, end_date = date_range
+
+        # 데이터 수집
+        data = feature.call_feature()
+
+        if (
+            data is None
+            or (isinstance(data, pd.DataFrame) and data.empty)
+            or (isinstance(data, dict) and not data)
+        ):
+            logger.warning(f"⚠️ {feature_name}: 데이터가 없습니다")
+            return False
+
+        if test_mode:
+            # 테스트 모드: 데이터 요약만 출력
+            if isinstance(data, dict):
+                logger.warning(f"🔍 {feature_name}: {len(data)}개 코드 데이터 확인됨")
+            elif isinstance(data, pd.DataFrame):
+                logger.warning(f"🔍 {feature_name}: {len(data)}행 데이터 확인됨")
+            return None
+
+        # 파일 저장 (증분 업데이트 지원)
+        return save_feature(
+            feature_name,
+            data,
+            start_date,
+            end_date,
+            output_dir,
+            fmt=fmt,
+            append=append,
+            max_workers=write_workers,
+        )
+
+    except Exception as e:
+        logger.error(
+            "❌ %s 처리 중 오류: %s",
+            feature_name,
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         return False
 
 
@@ -371,6 +782,8 @@ def collect_and_save_data(
     scheduled_only: bool = False,
     test_mode: bool = False,
     output_dir: str = "data",
+    fmt: str = "csv",
+    append: bool = False,
 ) -> None:
     """피처 데이터 수집 및 CSV 저장
 
@@ -383,26 +796,30 @@ def collect_and_save_data(
         scheduled_only: True이면 스케줄된 피처만 실행
         test_mode: True이면 테스트 모드 (CSV 저장 없음)
         output_dir: CSV 파일 저장 디렉토리
+        fmt: 저장 형식 (csv, parquet, both)
+        append: True이면 CSV 파일을 다시 쓰지 않고 새 행만 추가
     """
     try:
-        os.makedirs("logs", exist_ok=True)
         if time_str is None:
-            time_str = datetime.now().strftime("%H%M%S")
+            time_str = _now_hms()
 
         # 핵심 정보만 INFO 레벨로 출력
         logger.warning(
             f"🚀 데이터 수집 프로세스 시작: scheduled_only={scheduled_only}, test_mode={test_mode}"
         )
 
+        from src.feature_engineering.feature_manager import FeatureManager
+
+        # 지정된 피처만 처리할 때는 해당 피처만 로드
         feature_manager = FeatureManager(
             features_yaml_path=features_yaml_path,
             params_yaml_path=params_yaml_path,
             api_config_yaml_path=api_config_yaml_path,
+            preload=not features,
         )
 
-        # params.yaml에서 날짜 범위 읽기
-        with open(params_yaml_path, "r", encoding="utf-8") as f:
-            params_config = yaml.safe_load(f)
+        # params.yaml에서 날짜 범위 읽기 (FeatureManager가 읽은 파싱 결과를 캐시에서 재사용)
+        params_config = load_yaml(params_yaml_path)
 
         features_to_get_data_from: Dict[str, Any] = {}
 
@@ -431,7 +848,12 @@ def collect_and_save_data(
                 else:
                     logger.warning(f"⚠️ {name}: collect_data 메서드가 없습니다")
             except Exception as e:
-                logger.error(f"❌ {name}: 데이터 수집 중 오류 - {e}")
+                logger.error(
+                    "❌ %s: 데이터 수집 중 오류 - %s",
+                    name,
+                    e,
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
                 continue
 
         logger.warning(
@@ -444,47 +866,42 @@ def collect_and_save_data(
         if test_mode:
             logger.warning("🧪 테스트 모드: CSV 파일 저장 없이 데이터만 확인합니다.")
 
-        for feature_name, feature in features_to_get_data_from.items():
-            try:
-                # 피처별 날짜 범위 가져오기
-                feature_params = params_config.get(feature_name, {})
-                start_date = feature_params.get("start_date", "20250101")
-                end_date = feature_params.get("end_date", "20250531")
-
-                # 데이터 수집
-                data = feature.call_feature()
-
-                if (
-                    data is None
-                    or (isinstance(data, pd.DataFrame) and data.empty)
-                    or (isinstance(data, dict) and not data)
-                ):
-                    logger.warning(f"⚠️ {feature_name}: 데이터가 없습니다")
-                    failed_count += 1
-                    continue
-
-                if test_mode:
-                    # 테스트 모드: 데이터 요약만 출력
-                    if isinstance(data, dict):
-                        logger.warning(
-                            f"🔍 {feature_name}: {len(data)}개 코드 데이터 확인됨"
-                        )
-                    elif isinstance(data, pd.DataFrame):
-                        logger.warning(
-                            f"🔍 {feature_name}: {len(data)}행 데이터 확인됨"
-                        )
-                else:
-                    # CSV 저장 (증분 업데이트 지원)
-                    if save_feature_to_csv(
-                        feature_name, data, start_date, end_date, output_dir
-                    ):
+        # 피처별 날짜 범위를 미리 계산 (작업 스레드에서는 읽기 전용으로만 사용)
+        date_ranges: Dict[str, Tuple[str, str]] = {}
+        for feature_name in features_to_get_data_from:
+            feature_params = params_config.get(feature_name, {})
+            date_ranges[feature_name] = (
+                feature_params.get("start_date", "20250101"),
+                feature_params.get("end_date", "20250531"),
+            )
+
+        # 피처별 조회 및 저장을 스레드 풀에서 동시에 처리 (I/O 대기 시간 중첩)
+        # 피처 스레드 수 x 피처별 쓰기 스레드 수가 _MAX_IO_WORKERS를 넘지 않도록 분배
+        if features_to_get_data_from:
+            max_workers = min(_MAX_IO_WORKERS, len(features_to_get_data_from))
+            write_workers = max(1, _MAX_IO_WORKERS // max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _process_one,
+                        feature_name,
+                        feature,
+                        date_ranges[feature_name],
+                        output_dir,
+                        test_mode,
+                        fmt,
+                        append,
+                        write_workers,
+                    ): feature_name
+                    for feature_name, feature in features_to_get_data_from.items()
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is True:
                         success_count += 1
-                    else:
+                    elif result is False:
                         failed_count += 1
 
-            except Exception as e:
-                logger.error(f"❌ {feature_name} 처리 중 오류: {str(e)}")
-                failed_count += 1
         # 완료 메시지
         if test_mode:
             logger.warning(
@@ -492,18 +909,25 @@ def collect_and_save_data(
             )
         else:
             logger.warning(
-                f"📁 CSV 저장 완료: 성공 {success_count}개, 실패 {failed_count}개"
+                f"📁 파일 저장 완료 ({fmt}): 성공 {success_count}개, 실패 {failed_count}개"
             )
             if success_count > 0:
                 logger.warning(f"💾 저장 위치: {output_dir}/ 디렉토리")
 
     except Exception as e:
-        logger.error(f"❌ 데이터 수집 중 최상위 오류 발생: {str(e)}", exc_info=True)
+        # 트레이스백은 DEBUG 레벨에서만 기록
+        logger.error(
+            "❌ 데이터 수집 중 최상위 오류 발생: %s",
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
 
 
 def main():
     """메인 함수"""
+    # --help나 인수 오류로 종료되는 경우에는 로그 파일/리스너 스레드를 만들지 않음
     args = parse_args()
+    _setup_logging()
 
     # 쉼표로 구분된 피처 이름을 리스트로 변환
     features = args.features.split(",") if args.features else None
@@ -517,6 +941,8 @@ def main():
         scheduled_only=args.scheduled,
         test_mode=args.test,
         output_dir=args.output_dir,
+        fmt=args.format,
+        append=args.append,
     )
 
 
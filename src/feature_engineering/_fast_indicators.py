@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+"""
+기술적 지표 고속 계산 모듈
+
+가격 배열을 한 번만 순회하면서 여러 지표를 계산하는 Numba 커널을 제공합니다.
+Numba가 설치되지 않은 환경에서는 같은 함수가 순수 Python으로 실행됩니다 (결과 동일, 속도만 느림).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba 미설치 환경
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba.njit 대체 데코레이터 (함수를 그대로 반환)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def rolling_means(price, windows):
+    """
+    여러 윈도우의 단순이동평균을 한 번의 순회로 계산합니다.
+
+    윈도우별 누적합에 들어오는 값을 더하고 빠지는 값을 빼는 방식으로 갱신합니다.
+    pandas `rolling(window=w).mean()`과 같이 윈도우가 채워지기 전이나 윈도우 안에
+    NaN이 있으면 NaN을 반환합니다.
+
+    Args:
+        price (np.ndarray): float64 가격 배열
+        windows (np.ndarray): int64 윈도우 크기 배열
+
+    Returns:
+        np.ndarray: (len(price), len(windows)) 형태의 이동평균 행렬
+    """
+    n = price.shape[0]
+    k = windows.shape[0]
+    out = np.full((n, k), np.nan)
+    sums = np.zeros(k)
+    nan_counts = np.zeros(k, dtype=np.int64)
+
+    for i in range(n):
+        x = price[i]
+        x_nan = np.isnan(x)
+        for j in range(k):
+            w = windows[j]
+            # 들어오는 값 반영
+            if x_nan:
+                nan_counts[j] += 1
+            else:
+                sums[j] += x
+            # 윈도우에서 빠지는 값 제거
+            if i >= w:
+                old = price[i - w]
+                if np.isnan(old):
+                    nan_counts[j] -= 1
+                else:
+                    sums[j] -= old
+            if i >= w - 1 and nan_counts[j] == 0:
+                out[i, j] = sums[j] / w
+    return out
+
+
+@njit(cache=True, nogil=True)
+def ewma(x, span):
+    """
+    지수이동평균을 계산합니다 (pandas `ewm(span=span).mean()`과 동일한 adjust=True 방식).
+
+    가중 평균을 점화식으로 한 번에 갱신하며, NaN은 pandas와 같이 가중치만 감쇠시키고
+    직전 값을 유지합니다.
+
+    Args:
+        x (np.ndarray): float64 입력 배열
+        span (int): 지수이동평균 기간
+
+    Returns:
+        np.ndarray: 지수이동평균 배열
+    """
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    alpha = 2.0 / (span + 1.0)
+    old_wt_factor = 1.0 - alpha
+    weighted = x[0]
+    old_wt = 1.0
+    out[0] = weighted
+
+    for i in range(1, n):
+        cur = x[i]
+        is_obs = not np.isnan(cur)
+        if not np.isnan(weighted):
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + cur) / (old_wt + 1.0)
+                old_wt += 1.0
+        elif is_obs:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True, nogil=True)
+def wilder_rsi(price, period):
+    """
+    Wilder 평활 방식의 RSI를 한 번의 순회로 계산합니다 (TA-Lib RSI와 동일한 방식).
+
+    첫 `period`개 가격 변화의 단순평균으로 평균 상승폭/하락폭을 초기화한 뒤
+    `avg = (avg * (period - 1) + 현재값) / period` 점화식으로 갱신합니다.
+    가격이 NaN이어서 변화량을 구할 수 없는 구간은 변화 0으로 처리합니다.
+
+    Args:
+        price (np.ndarray): float64 가격 배열
+        period (int): RSI 기간
+
+    Returns:
+        np.ndarray: RSI 배열 (초기 `period`개 구간은 NaN)
+    """
+    n = price.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        delta = price[i] - price[i - 1]
+        gain = 0.0
+        loss = 0.0
+        if delta > 0:
+            gain = delta
+        elif delta < 0:
+            loss = -delta
+
+        if i <= period:
+            # 초기 구간: 단순평균으로 시드
+            avg_gain += gain / period
+            avg_loss += loss / period
+            if i < period:
+                continue
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _window_moments(x, start, end):
+    """
+    구간 [start, end)의 평균과 편차제곱합을 두 번의 순회로 정확히 계산합니다.
+
+    슬라이딩 Welford 갱신에 누적되는 반올림 오차를 주기적으로 없애기 위해 사용합니다.
+
+    Args:
+        x (np.ndarray): NaN이 없는 구간을 포함한 float64 배열
+        start (int): 시작 인덱스
+        end (int): 끝 인덱스 (미포함)
+
+    Returns:
+        tuple: (평균, 편차제곱합)
+    """
+    total = 0.0
+    for j in range(start, end):
+        total += x[j]
+    mean = total / (end - start)
+    m2 = 0.0
+    for j in range(start, end):
+        d = x[j] - mean
+        m2 += d * d
+    return mean, m2
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_std(price, window):
+    """
+    이동평균과 이동표준편차(표본, ddof=1)를 한 번의 순회로 계산합니다.
+
+    윈도우에 값이 들어오고 빠질 때마다 평균과 편차제곱합(M2)을 Welford 방식으로 갱신하므로
+    값의 크기가 커도 E[x²]-E[x]² 방식의 상쇄 오차가 생기지 않습니다.
+    NaN 처리는 pandas `rolling`과 같습니다.
+
+    Args:
+        price (np.ndarray): float64 가격 배열
+        window (int): 윈도우 크기
+
+    Returns:
+        np.ndarray: (len(price), 2) 형태의 [이동평균, 이동표준편차] 행렬
+    """
+    n = price.shape[0]
+    out = np.full((n, 2), np.nan)
+
+    nobs = 0
+    mean = 0.0
+    m2 = 0.0
+    # 평균 갱신의 Kahan 보정항 (pandas roll_var와 동일)
+    comp_add = 0.0
+    comp_remove = 0.0
+    for i in range(n):
+        # 윈도우에서 빠지는 값 제거
+        if i >= window:
+            old = price[i - window]
+            if not np.isnan(old):
+                nobs -= 1
+                if nobs == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    prev_mean = mean - comp_remove
+                    y = old - comp_remove
+                    t = y - mean
+                    comp_remove = t + mean - y
+                    mean -= t / nobs
+                    m2 -= (old - prev_mean) * (old - mean)
+
+        # 들어오는 값 반영
+        x = price[i]
+        if not np.isnan(x):
+            nobs += 1
+            prev_mean = mean - comp_add
+            y = x - comp_add
+            t = y - mean
+            comp_add = t + mean - y
+            mean += t / nobs
+            m2 += (x - prev_mean) * (x - mean)
+
+        if nobs == window:
+            if (i + 1) % window == 0:
+                # 윈도우 길이마다 누적 오차를 정확한 값으로 재설정
+                mean, m2 = _window_moments(price, i + 1 - window, i + 1)
+                comp_add = 0.0
+                comp_remove = 0.0
+            out[i, 0] = mean
+            if window > 1:
+                out[i, 1] = np.sqrt(m2 / (window - 1)) if m2 > 0 else 0.0
+    return out
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def batch_rolling(X, window, out_mean, out_std, out_min, out_max):
+    """
+    여러 컬럼의 이동 평균/표준편차(ddof=1)/최소/최대를 컬럼별 병렬로 계산합니다.
+
+    컬럼마다 한 번의 순회로 네 통계량을 모두 갱신합니다. 평균과 표준편차는 Welford 방식,
+    최소/최대는 단조 덱(monotonic deque)을 사용하므로 윈도우 크기와 무관하게 O(n)입니다.
+    윈도우가 채워지기 전이나 윈도우 안에 NaN이 있으면 pandas `rolling`과 같이 NaN입니다.
+
+    Args:
+        X (np.ndarray): (행, 컬럼) float64 행렬
+        window (int): 윈도우 크기
+        out_mean (np.ndarray): 이동평균 출력 (X와 같은 형태)
+        out_std (np.ndarray): 이동표준편차 출력
+        out_min (np.ndarray): 이동최소 출력
+        out_max (np.ndarray): 이동최대 출력
+    """
+    n, n_cols = X.shape
+    for c in prange(n_cols):
+        # 단조 덱: 인덱스를 저장하는 링 버퍼 (head ~ tail-1)
+        min_q = np.empty(n, dtype=np.int64)
+        max_q = np.empty(n, dtype=np.int64)
+        min_head = 0
+        min_tail = 0
+        max_head = 0
+        max_tail = 0
+
+        nobs = 0
+        mean = 0.0
+        m2 = 0.0
+        # 평균 갱신의 Kahan 보정항 (pandas roll_var와 동일)
+        comp_add = 0.0
+        comp_remove = 0.0
+        for i in range(n):
+            # 윈도우에서 빠지는 값 제거
+            if i >= window:
+                old = X[i - window, c]
+                if not np.isnan(old):
+                    nobs -= 1
+                    if nobs == 0:
+                        mean = 0.0
+                        m2 = 0.0
+                    else:
+                        prev_mean = mean - comp_remove
+                        y = old - comp_remove
+                        t = y - mean
+                        comp_remove = t + mean - y
+                        mean -= t / nobs
+                        m2 -= (old - prev_mean) * (old - mean)
+                if min_head < min_tail and min_q[min_head] <= i - window:
+                    min_head += 1
+                if max_head < max_tail and max_q[max_head] <= i - window:
+                    max_head += 1
+
+            # 들어오는 값 반영
+            x = X[i, c]
+            if not np.isnan(x):
+                nobs += 1
+                prev_mean = mean - comp_add
+                y = x - comp_add
+                t = y - mean
+                comp_add = t + mean - y
+                mean += t / nobs
+                m2 += (x - prev_mean) * (x - mean)
+                while min_tail > min_head and X[min_q[min_tail - 1], c] >= x:
+                    min_tail -= 1
+                min_q[min_tail] = i
+                min_tail += 1
+                while max_tail > max_head and X[max_q[max_tail - 1], c] <= x:
+                    max_tail -= 1
+                max_q[max_tail] = i
+                max_tail += 1
+
+            if nobs == window:
+                if (i + 1) % window == 0:
+                    # 윈도우 길이마다 누적 오차를 정확한 값으로 재설정
+                    mean, m2 = _window_moments(X[:, c], i + 1 - window, i + 1)
+                    comp_add = 0.0
+                    comp_remove = 0.0
+                out_mean[i, c] = mean
+                if window > 1:
+                    out_std[i, c] = np.sqrt(m2 / (window - 1)) if m2 > 0 else 0.0
+                else:
+                    out_std[i, c] = np.nan
+                out_min[i, c] = X[min_q[min_head], c]
+                out_max[i, c] = X[max_q[max_head], c]
+            else:
+                out_mean[i, c] = np.nan
+                out_std[i, c] = np.nan
+                out_min[i, c] = np.nan
+                out_max[i, c] = np.nan
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def interact(a, b, mult_out, div_out, eps):
+    """
+    두 피처의 곱과 비율을 한 번의 순회로 계산합니다.
+
+    두 입력을 한 번만 읽고 두 결과를 함께 쓰므로 곱/나눗셈을 따로 계산할 때보다
+    메모리 읽기가 절반입니다. NaN은 일반 산술과 같이 전파됩니다.
+
+    Args:
+        a (np.ndarray): 첫 번째 피처 배열
+        b (np.ndarray): 두 번째 피처 배열
+        mult_out (np.ndarray): a * b 출력 배열
+        div_out (np.ndarray): a / (b + eps) 출력 배열
+        eps (float): 0으로 나누기 방지용 값
+    """
+    for i in prange(a.shape[0]):
+        x = a[i]
+        y = b[i]
+        mult_out[i] = x * y
+        div_out[i] = x / (y + eps)
+
+
+def warmup():
+    """
+    모든 커널을 파이프라인에서 쓰는 입력 타입으로 한 번씩 호출해 컴파일합니다.
+
+    커널은 `cache=True`로 컴파일 결과를 `__pycache__`에 저장하므로, 배포나 컨테이너
+    빌드 단계에서 `python -m src.feature_engineering._fast_indicators`로 한 번 실행해 두면
+    이후 프로세스는 첫 호출 시 JIT 컴파일 없이 저장된 기계어를 바로 불러옵니다.
+    """
+    price = np.linspace(1.0, 2.0, 64)
+    # pandas Copy-on-Write의 to_numpy()는 읽기 전용 배열을 반환하므로 두 경우 모두 컴파일
+    readonly = price.copy()
+    readonly.flags.writeable = False
+    for x in (price, readonly):
+        rolling_means(x, np.array([5, 20], dtype=np.int64))
+        ewma(x, 5)
+        wilder_rsi(x, 14)
+        rolling_mean_std(x, 20)
+
+    for dtype in (np.float32, np.float64):
+        for writeable in (True, False):
+            X = np.ascontiguousarray(np.tile(price, (2, 1)).T, dtype=dtype)
+            X.flags.writeable = writeable
+            outs = tuple(np.empty(X.shape, dtype=dtype) for _ in range(4))
+            batch_rolling(X, 5, *outs)
+            a = X[:, 0].copy()
+            a.flags.writeable = writeable
+            interact(a, a, np.empty(len(a), dtype), np.empty(len(a), dtype), 1e-8)
+
+
+if __name__ == "__main__":
+    warmup()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+숫자 문자열 고속 파싱 모듈
+
+API 응답의 숫자 문자열 블록(행 x 컬럼)을 Numba로 컴파일된 커널에서 한 번에 float64로 변환합니다.
+Numba가 설치되지 않은 환경에서는 NUMBA_AVAILABLE이 False가 되며, 호출자는 pandas 경로를 사용해야 합니다.
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba 미설치 환경
+    njit = None
+    NUMBA_AVAILABLE = False
+
+# 이 셀 수(행 x 컬럼) 이상일 때만 컴파일된 커널 사용 (작은 응답은 pandas가 더 빠름)
+THRESHOLD = 5000
+
+# float64로 정확하게 표현할 수 있는 최대 자릿수 (10**15 < 2**53)
+# 정수 컬럼도 float64 출력 배열을 거쳐 int64로 변환되므로 이보다 긴 값은 pandas로 처리
+_MAX_DIGITS = 15
+
+_SPACE = 32
+_PLUS = 43
+_MINUS = 45
+_DOT = 46
+_ZERO = 48
+_NINE = 57
+
+
+def _parse_numeric_block_py(raw, out, has_frac):  # pragma: no cover - njit 대상
+    """
+    ASCII 바이트 행렬을 float64 행렬로 변환합니다.
+
+    공백만 있는 값은 0으로, 부호/소수점이 포함된 10진수는 해당 값으로 변환합니다.
+    그 외 형식(지수 표기, 쉼표 등)을 만나면 즉시 False를 반환하므로 호출자가 pandas로 처리해야 합니다.
+
+    Args:
+        raw (np.ndarray): (행, 컬럼, 문자폭) 형태의 uint8 배열 (0으로 패딩)
+        out (np.ndarray): (행, 컬럼) 형태의 float64 출력 배열
+        has_frac (np.ndarray): 컬럼별 소수점 포함 여부를 기록할 bool 배열
+
+    Returns:
+        bool: 모든 값을 변환했으면 True
+    """
+    n_rows, n_cols, width = raw.shape
+    for i in range(n_rows):
+        for j in range(n_cols):
+            k = 0
+            # 앞쪽 공백 건너뛰기
+            while k < width and raw[i, j, k] == _SPACE:
+                k += 1
+            if k == width or raw[i, j, k] == 0:
+                out[i, j] = 0.0
+                continue
+
+            sign = 1.0
+            c = raw[i, j, k]
+            if c == _MINUS or c == _PLUS:
+                if c == _MINUS:
+                    sign = -1.0
+                k += 1
+
+            int_part = 0
+            frac_part = 0
+            scale = 1
+            digits = 0
+            seen_dot = False
+            while k < width:
+                c = raw[i, j, k]
+                if c >= _ZERO and c <= _NINE:
+                    digits += 1
+                    if digits > _MAX_DIGITS:
+                        return False
+                    if seen_dot:
+                        frac_part = frac_part * 10 + (c - _ZERO)
+                        scale *= 10
+                    else:
+                        int_part = int_part * 10 + (c - _ZERO)
+                elif c == _DOT and not seen_dot:
+                    seen_dot = True
+                    has_frac[j] = True
+                else:
+                    break
+                k += 1
+
+            # 뒤쪽 공백 이후에는 패딩(0)만 허용
+            while k < width and raw[i, j, k] == _SPACE:
+                k += 1
+            if digits == 0 or (k < width and raw[i, j, k] != 0):
+                return False
+
+            out[i, j] = sign * (int_part + frac_part / scale)
+    return True
+
+
+if NUMBA_AVAILABLE:
+    parse_numeric_block = njit(cache=True, nogil=True)(_parse_numeric_block_py)
+else:
+    parse_numeric_block = None
+
+
+def parse_numeric_strings(raw: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    숫자 문자열 2차원 배열을 float64 행렬로 변환합니다.
+
+    Args:
+        raw (np.ndarray): (행, 컬럼) 형태의 object 배열
+
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray]]: (float64 행렬, 컬럼별 소수점 포함 여부).
+            Numba가 없거나 커널이 처리할 수 없는 값이 있으면 None
+    """
+    if parse_numeric_block is None:
+        return None
+
+    try:
+        # 고정폭 ASCII 바이트 배열로 변환 후 (행, 컬럼, 문자폭) uint8 뷰 생성
+        encoded = np.ascontiguousarray(raw.astype("S"))
+    except (UnicodeEncodeError, ValueError, TypeError):
+        return None
+
+    width = encoded.dtype.itemsize
+    n_rows, n_cols = encoded.shape
+    byte_view = encoded.view(np.uint8).reshape(n_rows, n_cols, width)
+
+    out = np.empty((n_rows, n_cols), dtype=np.float64)
+    has_frac = np.zeros(n_cols, dtype=np.bool_)
+    if not parse_numeric_block(byte_view, out, has_frac):
+        return None
+    return out, has_frac
@@ -8,30 +8,55 @@
 
 from abc import ABCMeta, abstractmethod
 import logging
-import copy
 from typing import Dict, List, Any, Optional, Union, Callable, TypeVar
-import os
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import functools
+import re
+import time
 from src.utils.api_config_manager import get_api_config
+from src.feature_engineering import _fast_parse
 
 logger = logging.getLogger(__name__)
 
 # 데코레이터의 반환 타입을 위한 제네릭 타입 변수
 T = TypeVar("T")
 
+# 공백 문자열 판별 정규식 (숫자 변환 전 "0"으로 치환)
+_BLANK_RE = re.compile(r"^\s*$")
+
+# 기본 파라미터로 쓸 수 없는 예시값 문자(공백, 괄호) 삭제 테이블
+_INVALID_EXAMPLE_CHARS = str.maketrans("", "", " ()")
+
+# 토큰 만료/무효를 나타내는 KIS 응답 코드 (수신 시 캐시된 토큰 폐기)
+_AUTH_ERROR_CODES = frozenset({"EGW00121", "EGW00123"})
+
+# 캐시된 액세스 토큰 유효 시간 (초)
+_TOKEN_TTL_SEC = 300
+
+# 조회 결과가 없음을 나타내는 센티널 (None도 유효한 저장값이므로 구분)
+_MISSING = object()
+
+
+def _format_yyyymmdd(dt: datetime) -> str:
+    """datetime을 YYYYMMDD 문자열로 변환합니다 (strftime보다 빠른 정수 포맷)."""
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+
 
 def api_error_handler(func: Callable[..., T]) -> Callable[..., Optional[T]]:
     """
     API 호출 함수에 오류 처리를 추가하는 데코레이터
 
+    함수에 `_returns_dict = False` 속성이 있으면 응답 코드 검사를 생략합니다.
+
     Args:
         func: 데코레이팅할 함수
 
     Returns:
         오류 처리가 추가된 래퍼 함수
     """
+    check_result = getattr(func, "_returns_dict", True)
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -39,21 +64,22 @@ def api_error_handler(func: Callable[..., T]) -> Callable[..., Optional[T]]:
             result = func(self, *args, **kwargs)
 
             # API 응답이 딕셔너리이고 오류 코드가 있는 경우
-            if (
-                isinstance(result, dict)
-                and "rt_cd" in result
-                and result.get("rt_cd") != "0"
-            ):
-                self.log_error(
-                    f"API Error in {func.__name__}: {result.get('msg1')} (code: {result.get('rt_cd')})"
-                )
+            if check_result and result.__class__ is dict:
+                rt_cd = result.get("rt_cd")
+                if rt_cd is not None and rt_cd != "0":
+                    self.log_error(
+                        "API Error in %s: %s (code: %s)",
+                        func.__name__,
+                        result.get("msg1"),
+                        rt_cd,
+                    )
 
             return result
         except Exception as e:
-            self.log_error(f"Exception in {func.__name__}: {e}")
-            import traceback
-
-            self.log_error(traceback.format_exc())
+            # 트레이스백은 로그가 실제로 출력될 때만 포맷됨
+            logger.exception(
+                "[%s] Exception in %s: %s", self.feature_name, func.__name__, e
+            )
             return None
 
     return wrapper
@@ -79,8 +105,35 @@ class Feature(metaclass=ABCMeta):
     - **값 제공**: 외부(주로 전략 모듈)에서 `call_feature` 메서드를 통해 피처가 계산한 최종 값이나
       내부 상태를 요청할 수 있습니다.
     - **API 스키마 활용**: API 스키마를 활용하여 표준화된 방식으로 API 요청 및 응답을 처리합니다.
+    - **메모리 사용**: 기본 클래스 속성은 `__slots__`로 선언되어 있습니다. 하위 클래스도 자체 속성을
+      `__slots__`로 선언해야 인스턴스별 `__dict__`가 생기지 않습니다 (선언하지 않아도 동작은 동일).
     """
 
+    __slots__ = (
+        "feature_name",
+        "code_list",
+        "feature_query",
+        "quote_connect",
+        "inquiry",
+        "_inquiry_time_list",
+        "_inquiry_time_set",
+        "inquiry_name_list",
+        "params",
+        "health_check_value",
+        "_api_schema",
+        "_api_cache",
+        "_token_cache",
+        "_token_ttl",
+        "_base_headers",
+        "_tr_specific_headers",
+        "_api_config",
+        "_token_fn",
+        "_request_fn",
+        "feature_data",
+        "start_date",
+        "end_date",
+    )
+
     def __init__(
         self,
         _feature_name,
@@ -122,6 +175,13 @@ class Feature(metaclass=ABCMeta):
 
         # API 스키마 관련 속성 초기화
         self._api_schema = None
+        # API 스키마 조회 결과 캐시 ((조회 종류, API 이름) -> 결과)
+        self._api_cache: Dict[tuple, Any] = {}
+        # 액세스 토큰 캐시 ((토큰, 만료 시각(monotonic)) 또는 None)
+        self._token_cache: Optional[tuple] = None
+        self._token_ttl = _TOKEN_TTL_SEC
+        # API 설정 관리자 (get_tr_id 최초 호출 시 설정)
+        self._api_config = None
 
         # 피처 데이터 저장소
         self.feature_data = {}
@@ -141,26 +201,33 @@ class Feature(metaclass=ABCMeta):
                 self.start_date = self.params.get("start_date")
                 self.end_date = self.params.get("end_date")
                 self.log_info(
-                    f"Set date range from params: {self.start_date} ~ {self.end_date}"
+                    "Set date range from params: %s ~ %s", self.start_date, self.end_date
                 )
             # fetch_days 기반 설정
             elif "fetch_days" in self.params:
                 fetch_days = self.params.get("fetch_days", 1)
-                today = datetime.now().strftime("%Y%m%d")
+                now = datetime.now()
                 # 오늘 - fetch_days ~ 오늘
-                self.start_date = (
-                    datetime.now() - timedelta(days=fetch_days)
-                ).strftime("%Y%m%d")
-                self.end_date = today
+                self.start_date = _format_yyyymmdd(now - timedelta(days=fetch_days))
+                self.end_date = _format_yyyymmdd(now)
                 self.log_info(
-                    f"Set date range based on fetch_days={fetch_days}: {self.start_date} ~ {self.end_date}"
+                    "Set date range based on fetch_days=%s: %s ~ %s",
+                    fetch_days,
+                    self.start_date,
+                    self.end_date,
                 )
             else:
                 # 기본값: 오늘
-                today = datetime.now().strftime("%Y%m%d")
+                today = _format_yyyymmdd(datetime.now())
                 self.start_date = today
                 self.end_date = today
 
+        # feature_query의 토큰/요청 메서드를 미리 확인 (매 요청마다 hasattr/callable 검사 생략)
+        self._resolve_query_methods()
+
+        # 요청마다 변하지 않는 헤더는 한 번만 구성
+        self._build_base_headers()
+
         # 하위 클래스의 파라미터 초기화 메서드 호출
         self._initialize_params()
 
@@ -186,6 +253,36 @@ class Feature(metaclass=ABCMeta):
         """
         return self.feature_query  # APIClient 객체 반환
 
+    def _cached_api_lookup(
+        self, kind: str, api_name: str, loader: Callable[[], T]
+    ) -> T:
+        """
+        API 스키마 조회 결과를 (조회 종류, API 이름) 키로 캐시하여 반환합니다.
+        스키마는 실행 중 변하지 않으므로 같은 API에 대한 반복 조회는 캐시에서 처리합니다.
+
+        Args:
+            kind (str): 조회 종류 (예: 'api', 'params', 'endpoint')
+            api_name (str): API 이름
+            loader (Callable): 캐시에 없을 때 값을 생성하는 함수
+
+        Returns:
+            조회 결과
+        """
+        key = (kind, api_name)
+        if key in self._api_cache:
+            return self._api_cache[key]
+
+        value = loader()
+        self._api_cache[key] = value
+        return value
+
+    def reload_schema(self):
+        """
+        API 스키마 조회 캐시를 비웁니다.
+        스키마가 변경된 경우 호출하면 다음 조회부터 스키마에서 다시 읽습니다.
+        """
+        self._api_cache.clear()
+
     def get_api_by_name(self, api_name: str) -> Dict:
         """
         API 이름으로 API 정보를 조회합니다.
@@ -200,7 +297,9 @@ class Feature(metaclass=ABCMeta):
         if not api_schema:
             return {}
 
-        return api_schema.get_api_by_name(api_name) or {}
+        return self._cached_api_lookup(
+            "api", api_name, lambda: api_schema.get_api_by_name(api_name) or {}
+        )
 
     def get_api_request_params(self, api_name: str) -> Dict:
         """
@@ -216,8 +315,11 @@ class Feature(metaclass=ABCMeta):
         if not api_schema:
             return {}
 
-        headers, query_params = api_schema.get_request_params(api_name)
-        return {"header_params": headers, "query_params": query_params}
+        def load():
+            headers, query_params = api_schema.get_request_params(api_name)
+            return {"header_params": headers, "query_params": query_params}
+
+        return self._cached_api_lookup("params", api_name, load)
 
     def get_api_endpoint(self, api_name: str) -> Dict:
         """
@@ -233,7 +335,9 @@ class Feature(metaclass=ABCMeta):
         if not api_schema:
             return {}
 
-        return api_schema.get_api_endpoint(api_name) or {}
+        return self._cached_api_lookup(
+            "endpoint", api_name, lambda: api_schema.get_api_endpoint(api_name) or {}
+        )
 
     def prepare_api_request(self, api_name: str, **query_params) -> Dict:
         """
@@ -250,38 +354,49 @@ class Feature(metaclass=ABCMeta):
         if not api_schema:
             return query_params
 
-        # 엔드포인트 정보 가져오기
-        endpoint = api_schema.get_api_endpoint(api_name) or {}
-
-        # method와 url_path 가져오기
-        method = endpoint.get("method", "GET")
-        url_path = endpoint.get("url_path", "")
-        tr_id = endpoint.get("production_tr_id", "")
-
-        # 요청 파라미터 기본값 준비
-        headers, params = api_schema.get_request_params(api_name)
-
-        # 기본 파라미터 생성
-        default_params = {}
-        for param in params:
-            param_name = param.get("param_name", "")
-            example = param.get("example_value_or_description", "")
-            if (
-                param_name
-                and isinstance(example, str)
-                and not any(c in example for c in [" ", "(", ")"])
-            ):
-                default_params[param_name] = example
-
-        # 사용자 제공 파라미터로 덮어쓰기
-        for key, value in query_params.items():
-            default_params[key] = value
+        def load_template():
+            get_bundle = getattr(api_schema, "get_api_bundle", None)
+            if callable(get_bundle):
+                # 엔드포인트와 파라미터 정보를 한 번의 조회로 가져오기
+                bundle = get_bundle(api_name) or {}
+                method = bundle.get("method", "GET")
+                url_path = bundle.get("url_path", "")
+                tr_id = bundle.get("tr_id", "")
+                params = bundle.get("params", [])
+            else:
+                # 엔드포인트 정보 가져오기
+                endpoint = self.get_api_endpoint(api_name)
+                method = endpoint.get("method", "GET")
+                url_path = endpoint.get("url_path", "")
+                tr_id = endpoint.get("production_tr_id", "")
+                params = self.get_api_request_params(api_name)["query_params"]
+
+            # 요청 파라미터 기본값 준비 (query_params와 무관하므로 API별로 한 번만 생성)
+            # 삭제 후 길이가 같으면 공백/괄호가 없는 예시값 (한 번의 C 레벨 스캔)
+            default_params = {}
+            for param in params:
+                param_name = param.get("param_name", "")
+                example = param.get("example_value_or_description", "")
+                if (
+                    param_name
+                    and isinstance(example, str)
+                    and len(example.translate(_INVALID_EXAMPLE_CHARS)) == len(example)
+                ):
+                    default_params[param_name] = example
+
+            # method, url_path, tr_id와 기본 파라미터
+            return method, url_path, tr_id, default_params
+
+        method, url_path, tr_id, default_params = self._cached_api_lookup(
+            "request_template", api_name, load_template
+        )
 
+        # 캐시된 기본 파라미터를 복사한 뒤 사용자 제공 파라미터로 덮어쓰기
         return {
             "method": method,
             "url_path": url_path,
             "tr_id": tr_id,
-            "params": default_params,
+            "params": {**default_params, **query_params},
         }
 
     @api_error_handler
@@ -302,14 +417,13 @@ class Feature(metaclass=ABCMeta):
         """
         # 오류 처리 (기본 오류 검사)
         if not response_data:
-            self.log_error(f"Empty response data for {api_name}")
+            self.log_error("Empty response data for %s", api_name)
             return {}
 
         rt_cd = response_data.get("rt_cd")
         if rt_cd and rt_cd != "0":
-            self.log_error(
-                f"API Error for {api_name}: {response_data.get('msg1')} (rt_cd: {rt_cd})"
-            )
+            msg1 = response_data.get("msg1")
+            self.log_error("API Error for %s: %s (rt_cd: %s)", api_name, msg1, rt_cd)
 
         # 기본 구현은 원본 데이터 반환
         return response_data
@@ -338,6 +452,33 @@ class Feature(metaclass=ABCMeta):
     #     """
     #     pass
 
+    @property
+    def inquiry_time_list(self):
+        """조회 시각(HHMMSS) 리스트"""
+        return self._inquiry_time_list
+
+    @inquiry_time_list.setter
+    def inquiry_time_list(self, value):
+        # 시각 포함 여부를 O(1)로 확인하기 위해 frozenset을 함께 갱신
+        self._inquiry_time_list = value
+        self._inquiry_time_set = frozenset(value or ())
+
+    def is_inquiry_time(self, clock) -> bool:
+        """
+        주어진 시각이 조회 시각에 포함되는지 확인합니다.
+
+        Args:
+            clock: 현재 시각 (HHMMSS 형식)
+
+        Returns:
+            bool: 조회 시각이면 True
+        """
+        try:
+            return clock in self._inquiry_time_set
+        except TypeError:
+            # 해시 불가능한 값(dict 등)은 조회 시각에 포함될 수 없음
+            return False
+
     def on_clock(self, clock):
         """
         매 시각(Clock) 이벤트 발생 시 호출되는 메서드.
@@ -351,15 +492,20 @@ class Feature(metaclass=ABCMeta):
             clock (str): 현재 시각 (HHMMSS 형식).
         """
         # inquiry가 활성화되어 있고 현재 시각이 inquiry_time_list에 포함된 경우 조회 수행
-        if self.inquiry and clock in self.inquiry_time_list:
-            logger.info(f"Feature '{self.feature_name}' performing inquiry at {clock}")
+        if self.inquiry and self.is_inquiry_time(clock):
+            logger.info(
+                "Feature '%s' performing inquiry at %s", self.feature_name, clock
+            )
             try:
                 # 실제 조회 로직은 하위 클래스에 위임
                 self._perform_inquiry(clock)
                 self.health_check_value = f"Inquiry performed at {clock}"
             except Exception as e:
                 logger.error(
-                    f"Error during _perform_inquiry for feature '{self.feature_name}' at {clock}: {e}"
+                    "Error during _perform_inquiry for feature '%s' at %s: %s",
+                    self.feature_name,
+                    clock,
+                    e,
                 )
                 self.health_check_value = f"Inquiry failed at {clock}"
 
@@ -433,15 +579,16 @@ class Feature(metaclass=ABCMeta):
     def save_data_with_schema(self, schema_name: str, table_name: str, data: Any):
         """
         스키마와 테이블 이름을 지정하여 피처 데이터를 저장합니다.
+        저장 키는 (schema_name, table_name) 튜플입니다.
 
         Args:
             schema_name (str): 스키마 이름
             table_name (str): 테이블 이름
             data (Any): 저장할 데이터
         """
-        key = f"{schema_name}.{table_name}"
-        self.feature_data[key] = data
-        self.log_debug(f"데이터 저장: {key}")
+        # (스키마, 테이블) 튜플 키 사용 (문자열 연결 없이 해시)
+        self.feature_data[(schema_name, table_name)] = data
+        self.log_debug("데이터 저장: %s.%s", schema_name, table_name)
 
     def get_data_with_schema(
         self, schema_name: str, table_name: str, default: Any = None
@@ -457,56 +604,82 @@ class Feature(metaclass=ABCMeta):
         Returns:
             Any: 저장된 데이터 또는 기본값
         """
-        key = f"{schema_name}.{table_name}"
-        return self.feature_data.get(key, default)
+        data = self.feature_data.get((schema_name, table_name), _MISSING)
+        if data is not _MISSING:
+            return data
+
+        # 이전 방식("스키마.테이블" 문자열 키)으로 저장된 데이터 호환
+        return self.feature_data.get(f"{schema_name}.{table_name}", default)
 
-    def clear_data(self, key: Optional[str] = None):
+    def clear_data(self, key: Optional[Union[str, tuple]] = None):
         """
         피처 데이터를 삭제합니다.
 
+        스키마 데이터는 "스키마.테이블" 문자열과 (스키마, 테이블) 튜플 중
+        어느 형식으로 지정해도 두 형식의 저장 키가 모두 삭제됩니다.
+
         Args:
-            key (Optional[str], optional): 삭제할 데이터 키. None이면 모든 데이터 삭제.
+            key (Optional[Union[str, tuple]], optional): 삭제할 데이터 키.
+                None이면 모든 데이터 삭제.
         """
         if key is None:
             self.feature_data.clear()
-        elif key in self.feature_data:
-            del self.feature_data[key]
+            return
+
+        self.feature_data.pop(key, None)
 
-    def log_info(self, message: str):
+        # save_data_with_schema의 튜플 키와 이전 방식의 문자열 키를 함께 처리
+        if isinstance(key, tuple) and len(key) == 2:
+            self.feature_data.pop(f"{key[0]}.{key[1]}", None)
+        elif isinstance(key, str) and "." in key:
+            self.feature_data.pop(tuple(key.split(".", 1)), None)
+
+    def log_info(self, message: str, *args):
         """
         정보 로그를 기록합니다.
 
         Args:
-            message (str): 로그 메시지
+            message (str): 로그 메시지 (args가 있으면 %-포맷 문자열)
+            *args: 메시지 포맷 인자 (로그가 실제로 출력될 때만 포맷됨)
         """
-        logger.info(f"[{self.feature_name}] {message}")
+        self._log(logging.INFO, message, args)
 
-    def log_error(self, message: str):
+    def log_error(self, message: str, *args):
         """
         오류 로그를 기록합니다.
 
         Args:
-            message (str): 로그 메시지
+            message (str): 로그 메시지 (args가 있으면 %-포맷 문자열)
+            *args: 메시지 포맷 인자 (로그가 실제로 출력될 때만 포맷됨)
         """
-        logger.error(f"[{self.feature_name}] {message}")
+        self._log(logging.ERROR, message, args)
 
-    def log_debug(self, message: str):
+    def log_debug(self, message: str, *args):
         """
         디버그 로그를 기록합니다.
 
         Args:
-            message (str): 로그 메시지
+            message (str): 로그 메시지 (args가 있으면 %-포맷 문자열)
+            *args: 메시지 포맷 인자 (로그가 실제로 출력될 때만 포맷됨)
         """
-        logger.debug(f"[{self.feature_name}] {message}")
+        self._log(logging.DEBUG, message, args)
 
-    def log_warning(self, message: str):
+    def log_warning(self, message: str, *args):
         """
         경고 로그를 기록합니다.
 
         Args:
-            message (str): 로그 메시지
+            message (str): 로그 메시지 (args가 있으면 %-포맷 문자열)
+            *args: 메시지 포맷 인자 (로그가 실제로 출력될 때만 포맷됨)
         """
-        logger.warning(f"[{self.feature_name}] {message}")
+        self._log(logging.WARNING, message, args)
+
+    def _log(self, level: int, message: str, args: tuple):
+        """피처 이름을 앞에 붙여 로그를 기록합니다. 포맷은 logging 모듈에 위임합니다."""
+        if args:
+            logger.log(level, "[%s] " + message, self.feature_name, *args)
+        else:
+            logger.log(level, "[%s] %s", self.feature_name, message)
 
     def __str__(self) -> str:
         """문자열 표현을 반환합니다."""
@@ -526,8 +699,43 @@ class Feature(metaclass=ABCMeta):
         Returns:
             Dict: API 요청 헤더
         """
+        # 기본 헤더(content-type, custtype, appkey, appsecret) 복사 후 요청별 값만 추가
+        headers = self._base_headers.copy()
+
+        # 액세스 토큰 가져오기
+        token = self._get_access_token()
+        self.log_debug(
+            "Token from APIQuery: %s", token[:8] + "********" if token else None
+        )
+
+        # 토큰이 있으면 인증 헤더 추가
+        if token:
+            headers["authorization"] = f"Bearer {token}"
+
+        # TR ID 설정 및 특정 TR ID에 대한 추가 헤더
+        if tr_id:
+            headers["tr_id"] = tr_id
+            headers.update(self._tr_specific_headers.get(tr_id, {}))
+
+        return headers
+
+    def _resolve_query_methods(self):
+        """
+        feature_query의 get_access_token/request 메서드를 바운드 메서드로 저장합니다.
+        호출할 수 없거나 없는 경우 None으로 둡니다. feature_query를 교체한 경우 다시 호출하세요.
+        """
+        token_fn = getattr(self.feature_query, "get_access_token", None)
+        self._token_fn = token_fn if callable(token_fn) else None
+        request_fn = getattr(self.feature_query, "request", None)
+        self._request_fn = request_fn if callable(request_fn) else None
+
+    def _build_base_headers(self):
+        """
+        요청마다 동일한 기본 헤더와 TR ID별 추가 헤더를 미리 구성합니다.
+        api_config가 바뀐 경우 다시 호출하면 헤더가 갱신됩니다.
+        """
         # 먼저 api_config 가져오기 (config/api_config.yaml 파일의 내용)
-        # 피처 파라미터에서 api_config를 찾거나, feature_query에서 가져오거나, 최상위 환경 변수 설정 등을 차례로 시도
+        # 피처 파라미터에서 api_config를 찾거나, feature_query에서 가져오기를 차례로 시도
         api_config = {}
 
         # 1. 파라미터에서 먼저 찾기
@@ -538,67 +746,53 @@ class Feature(metaclass=ABCMeta):
         if not api_config and hasattr(self.feature_query, "api_config"):
             api_config = self.feature_query.api_config or {}
 
-        # 액세스 토큰 가져오기
-        token = self._get_access_token()
-        self.log_debug(
-            f"Token from APIQuery: {token[:8] + '********' if token else None}"
-        )
-
-        # 기본 헤더 구성
         headers = {
             "content-type": "application/json; charset=utf-8",
             "custtype": api_config.get("CUS_TYPE", "P"),
+            "appkey": api_config.get("APP_KEY", ""),
+            "appsecret": api_config.get("APP_SECRET", ""),
         }
 
-        # 토큰이 있으면 인증 헤더 추가
-        if token:
-            headers["authorization"] = f"Bearer {token}"
-
-        # API 키 및 시크릿 설정
-        app_key = api_config.get("APP_KEY", "")
-        app_secret = api_config.get("APP_SECRET", "")
-
-        if app_key:
-            headers["appkey"] = app_key
-        if app_secret:
-            headers["appsecret"] = app_secret
-
-        # TR ID 설정 (파라미터로 제공되지 않은 경우 API 스키마에서 찾기)
-        if tr_id:
-            headers["tr_id"] = tr_id
-
-        # 특정 TR ID에 대한 추가 헤더가 있으면 추가
-        if tr_id and "tr_id_specific_headers" in api_config:
-            specific_headers = api_config.get("tr_id_specific_headers", {}).get(
-                tr_id, {}
-            )
-            headers.update(specific_headers)
-
-        # 값이 없는 헤더는 제거하고 반환
-        return {k: v for k, v in headers.items() if v}
+        # 값이 없는 헤더는 미리 제거
+        self._base_headers = {k: v for k, v in headers.items() if v}
+        self._tr_specific_headers = {
+            tr: {k: v for k, v in (extra or {}).items() if v}
+            for tr, extra in (api_config.get("tr_id_specific_headers") or {}).items()
+        }
 
     def _get_access_token(self) -> Optional[str]:
         """
         APIQuery 객체로부터 액세스 토큰을 가져옵니다.
+        가져온 토큰은 `_token_ttl`초 동안 캐시하여 요청마다 APIQuery를 거치지 않습니다.
 
         Returns:
             Optional[str]: 액세스 토큰 또는 None
         """
-        if hasattr(self.feature_query, "get_access_token") and callable(
-            self.feature_query.get_access_token
-        ):
+        cached = self._token_cache
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        if self._token_fn is not None:
             try:
-                token = self.feature_query.get_access_token()
+                token = self._token_fn()
                 if not token:
                     self.log_error("Failed to get access token from APIQuery.")
+                else:
+                    self._token_cache = (token, time.monotonic() + self._token_ttl)
                 return token
             except Exception as e:
-                self.log_error(f"Error getting access token: {e}")
+                self.log_error("Error getting access token: %s", e)
                 return None
         else:
             self.log_error("APIQuery object does not have a get_access_token method.")
             return None
 
+    def invalidate_token(self):
+        """
+        캐시된 액세스 토큰을 폐기합니다. 다음 요청 시 APIQuery에서 다시 가져옵니다.
+        """
+        self._token_cache = None
+
     def handle_api_error(self, response_data: Dict, api_name: str) -> bool:
         """
         API 오류 처리 통합 메서드
@@ -611,21 +805,22 @@ class Feature(metaclass=ABCMeta):
             bool: 성공(True) 또는 오류(False)
         """
         if not response_data:
-            self.log_error(f"No response data received for {api_name}")
+            self.log_error("No response data received for %s", api_name)
             return False
 
         rt_cd = response_data.get("rt_cd")
         if rt_cd != "0":
-            self.log_error(
-                f"API Error for {api_name}: {response_data.get('msg1')} (rt_cd: {rt_cd})"
-            )
+            msg1 = response_data.get("msg1")
+            self.log_error("API Error for %s: %s (rt_cd: %s)", api_name, msg1, rt_cd)
+
+            # 토큰 만료/무효 오류면 캐시된 토큰 폐기
+            if response_data.get("msg_cd") in _AUTH_ERROR_CODES:
+                self.invalidate_token()
 
             # 모의투자 지원하지 않는 API 처리
-            if "모의투자에서는 지원하지 않는 서비스" in str(
-                response_data.get("msg1", "")
-            ):
+            if msg1 and "모의투자에서는 지원하지 않는 서비스" in str(msg1):
                 self.log_warning(
-                    f"API {api_name} is not supported in the sandbox environment"
+                    "API %s is not supported in the sandbox environment", api_name
                 )
             return False
 
@@ -639,7 +834,8 @@ class Feature(metaclass=ABCMeta):
         date_column: str = "stck_bsop_date",
         date_format: str = "%Y%m%d",
         numeric_columns: List[str] = None,
-    ) -> Optional[pd.DataFrame]:
+        return_arrays: bool = False,
+    ) -> Optional[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
         """
         API 응답 데이터 기본 파싱 메서드
 
@@ -653,9 +849,11 @@ class Feature(metaclass=ABCMeta):
             date_column (str): 날짜 컬럼 이름 (기본값: "stck_bsop_date")
             date_format (str): 날짜 형식 (기본값: "%Y%m%d")
             numeric_columns (List[str]): 숫자로 변환할 컬럼 리스트
+            return_arrays (bool): True이면 DataFrame 대신 컬럼별 NumPy 배열 딕셔너리 반환
 
         Returns:
-            Optional[pd.DataFrame]: 파싱된 데이터프레임 또는 None
+            Optional[Union[pd.DataFrame, Dict[str, np.ndarray]]]: 파싱된 데이터프레임
+                (return_arrays=True이면 컬럼명 -> 배열 딕셔너리) 또는 None
         """
         # 오류 처리
         if not self.handle_api_error(response_data, api_name):
@@ -669,7 +867,7 @@ class Feature(metaclass=ABCMeta):
             if not output:
                 # 데이터가 없는 것은 정상적인 상황일 수 있으므로 debug 레벨로 변경
                 self.log_debug(
-                    f"No valid '{output_key}' data found in response for {api_name}"
+                    "No valid '%s' data found in response for %s", output_key, api_name
                 )
                 return None
 
@@ -678,36 +876,106 @@ class Feature(metaclass=ABCMeta):
             output = [output]
 
         if not isinstance(output, list) or not output:
-            self.log_warning(f"Invalid or empty data format in response for {api_name}")
+            self.log_warning("Invalid or empty data format in response for %s", api_name)
             return None
 
         try:
+            # DataFrame 생성 없이 컬럼별 배열만 필요한 경우
+            if return_arrays:
+                return self._parse_output_arrays(
+                    output, date_column, date_format, numeric_columns
+                )
+
             # DataFrame 변환
             df = pd.DataFrame(output)
 
             # 날짜 컬럼 처리
-            if date_column in df.columns:
+            # 이미 datetime이면 건너뛰고, 반복되는 날짜 문자열은 cache=True로 한 번만 파싱
+            if date_column in df.columns and not pd.api.types.is_datetime64_any_dtype(
+                df[date_column]
+            ):
                 df[date_column] = pd.to_datetime(
-                    df[date_column], format=date_format, errors="coerce"
+                    df[date_column], format=date_format, errors="coerce", cache=True
                 )
 
             # 숫자형 컬럼 변환
-            if numeric_columns:
-                for col in numeric_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_numeric(
-                            df[col].replace(r"^\s*$", "0", regex=True), errors="coerce"
-                        )
+            # 존재하는 컬럼만 골라 한 번의 replace/to_numeric으로 일괄 변환
+            cols = [c for c in dict.fromkeys(numeric_columns or ()) if c in df.columns]
+            if cols:
+                parsed = None
+                # 큰 응답은 컴파일된 커널로 블록 전체를 한 번에 변환
+                if len(df) * len(cols) >= _fast_parse.THRESHOLD:
+                    parsed = _fast_parse.parse_numeric_strings(
+                        df[cols].to_numpy(dtype=object)
+                    )
+
+                if parsed is not None:
+                    out, has_frac = parsed
+                    for j, col in enumerate(cols):
+                        # 소수점이 없는 컬럼은 pandas 경로와 같이 정수형 유지
+                        df[col] = out[:, j] if has_frac[j] else out[:, j].astype(np.int64)
+                else:
+                    sub = df[cols].replace(_BLANK_RE, "0", regex=True)
+                    df[cols] = sub.apply(pd.to_numeric, errors="coerce")
 
             return df
 
         except Exception as e:
-            self.log_error(f"Error parsing API response for {api_name}: {e}")
-            import traceback
-
-            self.log_error(traceback.format_exc())
+            logger.exception(
+                "[%s] Error parsing API response for %s: %s", self.feature_name, api_name, e
+            )
             return None
 
+    def _parse_output_arrays(
+        self,
+        output: List[Dict],
+        date_column: str,
+        date_format: str,
+        numeric_columns: Optional[List[str]],
+    ) -> Dict[str, np.ndarray]:
+        """
+        API 응답 레코드 리스트를 컬럼별 NumPy 배열로 변환합니다.
+
+        Args:
+            output (List[Dict]): API 응답 레코드 리스트
+            date_column (str): 날짜 컬럼 이름
+            date_format (str): 날짜 형식
+            numeric_columns (List[str]): 숫자로 변환할 컬럼 리스트
+
+        Returns:
+            Dict[str, np.ndarray]: 컬럼명 -> 배열 (날짜는 datetime64[D], 숫자는 float64/int64)
+        """
+        arrays = {
+            key: np.array([row.get(key, "") for row in output], dtype=object)
+            for key in output[0].keys()
+        }
+
+        # 날짜 컬럼: 파싱 실패 값은 NaT
+        if date_column in arrays:
+            arrays[date_column] = pd.to_datetime(
+                arrays[date_column], format=date_format, errors="coerce", cache=True
+            ).to_numpy(dtype="datetime64[D]")
+
+        cols = [c for c in dict.fromkeys(numeric_columns or ()) if c in arrays]
+        if not cols:
+            return arrays
+
+        parsed = None
+        if len(output) * len(cols) >= _fast_parse.THRESHOLD:
+            parsed = _fast_parse.parse_numeric_strings(
+                np.column_stack([arrays[c] for c in cols])
+            )
+
+        if parsed is not None:
+            out, has_frac = parsed
+            for j, col in enumerate(cols):
+                arrays[col] = out[:, j] if has_frac[j] else out[:, j].astype(np.int64)
+        else:
+            for col in cols:
+                values = pd.Series(arrays[col]).replace(_BLANK_RE, "0", regex=True)
+                arrays[col] = pd.to_numeric(values, errors="coerce").to_numpy()
+        return arrays
+
     @api_error_handler
     def perform_api_request(
         self,
@@ -739,10 +1007,8 @@ class Feature(metaclass=ABCMeta):
             headers = self._prepare_headers(tr_id)
 
         # 요청 수행
-        if hasattr(self.feature_query, "request") and callable(
-            self.feature_query.request
-        ):
-            return self.feature_query.request(
+        if self._request_fn is not None:
+            return self._request_fn(
                 method=method,
                 api_name=api_name,
                 tr_id=tr_id,
@@ -814,14 +1080,22 @@ class Feature(metaclass=ABCMeta):
         Returns:
             str: TR ID
         """
-        # YAML 설정에서 TR ID 조회
-        api_config = get_api_config()
-        tr_id = api_config.get_tr_id(api_name)
+        # API 설정 관리자는 최초 1회만 가져옴
+        if self._api_config is None:
+            self._api_config = get_api_config()
+        api_config = self._api_config
+
+        def load():
+            # YAML 설정에서 TR ID 조회
+            tr_id = api_config.get_tr_id(api_name)
+
+            if tr_id == "FHKIF03020100" and api_name not in api_config.config.get(
+                "tr_ids", {}
+            ):
+                # 설정에 없으면 경고 로그
+                self.log_warning("TR ID not found for API: %s, using default", api_name)
 
-        if tr_id == "FHKIF03020100" and api_name not in api_config.config.get(
-            "tr_ids", {}
-        ):
-            # 설정에 없으면 경고 로그
-            self.log_warning(f"TR ID not found for API: {api_name}, using default")
+            return tr_id
 
-        return tr_id
+        # API별 TR ID는 스키마 캐시에 저장 (reload_schema()로 초기화)
+        return self._cached_api_lookup("tr_id", api_name, load)
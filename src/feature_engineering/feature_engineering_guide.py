@@ -8,13 +8,112 @@ KOSPI 선물 퀀트 투자를 위한 피처 엔지니어링 가이드
 다양한 기법과 함수들을 제공합니다.
 """
 
+import logging
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 import warnings
 
+from src.feature_engineering._fast_indicators import (
+    batch_rolling,
+    ewma,
+    interact,
+    rolling_mean_std,
+    rolling_means,
+    wilder_rsi,
+)
+
 warnings.filterwarnings("ignore")
 
+logger = logging.getLogger(__name__)
+
+
+def _attach_columns(
+    df: pd.DataFrame, new_cols: Union[Dict[str, Any], pd.DataFrame]
+) -> pd.DataFrame:
+    """새 피처 컬럼들을 한 번의 concat으로 원본 DataFrame에 붙입니다.
+
+    원본을 복사하거나 컬럼을 하나씩 삽입하지 않으므로 원본은 변경되지 않고
+    블록 단편화도 생기지 않습니다. 같은 이름의 기존 컬럼은 새 값으로 대체됩니다.
+
+    Args:
+        df: 원본 DataFrame
+        new_cols: 컬럼명 -> 값(배열 또는 Series) 딕셔너리, 또는 원본과 같은 인덱스의 DataFrame
+
+    Returns:
+        새 컬럼이 추가된 DataFrame
+    """
+    if not isinstance(new_cols, pd.DataFrame):
+        if not new_cols:
+            return df
+        new_cols = pd.DataFrame(new_cols, index=df.index)
+    existing = set(df.columns)
+    overlap = [col for col in new_cols.columns if col in existing]
+    base = df.drop(columns=overlap) if overlap else df
+    return pd.concat([base, new_cols], axis=1)
+
+
+def _pairwise_corr(X: np.ndarray) -> np.ndarray:
+    """열 간 피어슨 상관계수 행렬을 행렬곱으로 계산합니다.
+
+    `DataFrame.corr()`와 같이 열 쌍마다 둘 다 값이 있는 행만 사용합니다 (pairwise complete).
+    결측값이 없으면 중심화 후 한 번의 행렬곱으로, 있으면 마스크 행렬곱 몇 번으로 계산합니다.
+
+    Args:
+        X: (행, 열) float64 배열
+
+    Returns:
+        (열, 열) 상관계수 행렬 (유효 쌍이 2개 미만이거나 분산이 0이면 NaN)
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        valid = ~np.isnan(X)
+        if valid.all():
+            # 결측값 없음: 중심화 후 공분산 한 번의 GEMM
+            Xc = X - X.mean(axis=0)
+            cov = Xc.T @ Xc
+            std = np.sqrt(np.diag(cov))
+            return cov / np.outer(std, std)
+
+        # 열 평균으로 중심화해 큰 값의 상쇄 오차를 줄인 뒤 결측값은 0으로 둠
+        mask = valid.astype(np.float64)
+        col_mean = np.nanmean(np.where(valid.any(axis=0), X, 0.0), axis=0)
+        X0 = np.where(valid, X - col_mean, 0.0)
+
+        # 쌍별 유효 개수, 합, 제곱합, 교차합
+        n = mask.T @ mask
+        sum_ij = X0.T @ mask  # (i, j): j가 유효한 행에서 i의 합
+        sq_ij = (X0 * X0).T @ mask
+        cross = X0.T @ X0
+
+        cov = cross - sum_ij * sum_ij.T / n
+        var_i = sq_ij - sum_ij * sum_ij / n
+        corr = cov / np.sqrt(var_i * var_i.T)
+        corr[n < 2] = np.nan
+        return corr
+
+
+def _lag_matrix(values: np.ndarray, lags: List[int]) -> np.ndarray:
+    """여러 시차를 한 번에 적용한 (행, 시차) 행렬을 만듭니다 (`Series.shift`와 동일).
+
+    Args:
+        values: 실수형 배열 (결과 행렬도 같은 dtype)
+        lags: 시차 리스트 (음수면 앞당김)
+
+    Returns:
+        시차별 값이 채워진 행렬 (범위 밖은 NaN)
+    """
+    n = len(values)
+    out = np.full((n, len(lags)), np.nan, dtype=values.dtype)
+    for j, lag in enumerate(lags):
+        if lag == 0:
+            out[:, j] = values
+        elif 0 < lag < n:
+            out[lag:, j] = values[:-lag]
+        elif -n < lag < 0:
+            out[:lag, j] = values[-lag:]
+    return out
+
 
 class FeatureEngineer:
     """피처 엔지니어링을 위한 메인 클래스"""
@@ -23,58 +122,66 @@ class FeatureEngineer:
         self.features_created = []
 
     def create_technical_indicators(
-        self, df: pd.DataFrame, price_col: str = "close"
+        self, df: pd.DataFrame, price_col: str = "close", dtype=np.float32
     ) -> pd.DataFrame:
         """기술적 지표 생성
 
+        지표 계산은 float64로 수행하고 결과 컬럼만 `dtype`으로 저장합니다.
+
         Args:
             df: 가격 데이터가 포함된 DataFrame
             price_col: 가격 컬럼명
+            dtype: 결과 컬럼 dtype. 기본값 float32는 유효숫자가 약 7자리라
+                지수 수준의 가격에서 소수점 셋째 자리 부근까지만 보존되지만,
+                피처 행렬의 메모리와 이후 연산의 메모리 대역폭이 절반으로 줄어듭니다.
+                원 정밀도가 필요하면 np.float64를 지정합니다.
 
         Returns:
             기술적 지표가 추가된 DataFrame
         """
-        result_df = df.copy()
+        sma_windows = [5, 10, 20, 60]
+        ema_windows = [5, 10, 20]
+        names = (
+            [f"sma_{window}" for window in sma_windows]
+            + [f"ema_{window}" for window in ema_windows]
+            + ["rsi_14", "bb_upper", "bb_lower", "bb_position"]
+            + ["macd", "macd_signal", "macd_histogram"]
+        )
+        price = df[price_col].to_numpy(dtype=np.float64)
 
-        # 1. 이동평균선 (SMA)
-        for window in [5, 10, 20, 60]:
-            col_name = f"sma_{window}"
-            result_df[col_name] = result_df[price_col].rolling(window=window).mean()
-            self.features_created.append(col_name)
+        # 모든 지표를 (지표, 행) 버퍼 하나에 채운 뒤 한 번만 DataFrame으로 감쌈
+        # (지표별 행이 연속이므로 pandas 블록에 복사 없이 그대로 사용됨)
+        buf = np.empty((len(names), len(price)), dtype=dtype)
+
+        # 1. 이동평균선 (SMA) - 모든 윈도우를 한 번의 순회로 계산
+        buf[0:4] = rolling_means(price, np.array(sma_windows, dtype=np.int64)).T
 
         # 2. 지수이동평균 (EMA)
-        for window in [5, 10, 20]:
-            col_name = f"ema_{window}"
-            result_df[col_name] = result_df[price_col].ewm(span=window).mean()
-            self.features_created.append(col_name)
+        for i, window in enumerate(ema_windows):
+            buf[4 + i] = ewma(price, window)
 
-        # 3. RSI (상대강도지수)
-        delta = result_df[price_col].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        result_df["rsi_14"] = 100 - (100 / (1 + rs))
-        self.features_created.append("rsi_14")
-
-        # 4. 볼린저 밴드
-        sma_20 = result_df[price_col].rolling(window=20).mean()
-        std_20 = result_df[price_col].rolling(window=20).std()
-        result_df["bb_upper"] = sma_20 + (std_20 * 2)
-        result_df["bb_lower"] = sma_20 - (std_20 * 2)
-        result_df["bb_position"] = (result_df[price_col] - result_df["bb_lower"]) / (
-            result_df["bb_upper"] - result_df["bb_lower"]
-        )
-        self.features_created.extend(["bb_upper", "bb_lower", "bb_position"])
+        # 3. RSI (상대강도지수, Wilder 평활)
+        buf[7] = wilder_rsi(price, 14)
+
+        # 4. 볼린저 밴드 (이동평균/표준편차를 한 번의 순회로 계산)
+        bands = rolling_mean_std(price, 20)
+        mid_20, std_20 = bands[:, 0], bands[:, 1]
+        bb_upper = mid_20 + (std_20 * 2)
+        bb_lower = mid_20 - (std_20 * 2)
+        buf[8] = bb_upper
+        buf[9] = bb_lower
+        buf[10] = (price - bb_lower) / (bb_upper - bb_lower)
 
         # 5. MACD
-        ema_12 = result_df[price_col].ewm(span=12).mean()
-        ema_26 = result_df[price_col].ewm(span=26).mean()
-        result_df["macd"] = ema_12 - ema_26
-        result_df["macd_signal"] = result_df["macd"].ewm(span=9).mean()
-        result_df["macd_histogram"] = result_df["macd"] - result_df["macd_signal"]
-        self.features_created.extend(["macd", "macd_signal", "macd_histogram"])
+        macd = ewma(price, 12) - ewma(price, 26)
+        macd_signal = ewma(macd, 9)
+        buf[11] = macd
+        buf[12] = macd_signal
+        buf[13] = macd - macd_signal
 
-        return result_df
+        self.features_created.extend(names)
+        indicators = pd.DataFrame(buf.T, index=df.index, columns=names, copy=False)
+        return _attach_columns(df, indicators)
 
     def create_volatility_features(
         self, df: pd.DataFrame, price_col: str = "close"
@@ -88,31 +195,30 @@ class FeatureEngineer:
         Returns:
             변동성 피처가 추가된 DataFrame
         """
-        result_df = df.copy()
+        new_cols = {}
+        price = df[price_col]
 
         # 1. 수익률 계산
-        result_df["return_1d"] = result_df[price_col].pct_change()
-        result_df["return_5d"] = result_df[price_col].pct_change(5)
-        result_df["return_20d"] = result_df[price_col].pct_change(20)
+        return_1d = price.pct_change()
+        new_cols["return_1d"] = return_1d
+        new_cols["return_5d"] = price.pct_change(5)
+        new_cols["return_20d"] = price.pct_change(20)
         self.features_created.extend(["return_1d", "return_5d", "return_20d"])
 
         # 2. 변동성 (Rolling Standard Deviation)
         for window in [5, 10, 20]:
             col_name = f"volatility_{window}d"
-            result_df[col_name] = result_df["return_1d"].rolling(window=window).std()
+            new_cols[col_name] = return_1d.rolling(window=window).std()
             self.features_created.append(col_name)
 
         # 3. 가격 범위 지표
-        if all(col in result_df.columns for col in ["high", "low"]):
-            result_df["price_range"] = (
-                result_df["high"] - result_df["low"]
-            ) / result_df[price_col]
-            result_df["price_range_ma"] = (
-                result_df["price_range"].rolling(window=20).mean()
-            )
+        if {"high", "low"}.issubset(df.columns):
+            price_range = (df["high"] - df["low"]) / price
+            new_cols["price_range"] = price_range
+            new_cols["price_range_ma"] = price_range.rolling(window=20).mean()
             self.features_created.extend(["price_range", "price_range_ma"])
 
-        return result_df
+        return _attach_columns(df, new_cols)
 
     def create_investor_behavior_features(
         self, investor_df: pd.DataFrame
@@ -125,7 +231,8 @@ class FeatureEngineer:
         Returns:
             투자자 행동 피처가 추가된 DataFrame
         """
-        result_df = investor_df.copy()
+        new_cols = {}
+        col_set = set(investor_df.columns)
 
         # 1. 순매수 비율 (외국인, 개인, 기관)
         for investor_type in ["frgn", "prsn", "orgn"]:
@@ -133,43 +240,43 @@ class FeatureEngineer:
             buy_col = f"{investor_type}_buy_amount"
             sell_col = f"{investor_type}_sell_amount"
 
-            if buy_col in result_df.columns and sell_col in result_df.columns:
-                total_amount = result_df[buy_col] + result_df[sell_col]
-                result_df[f"{investor_type}_net_buy_ratio"] = (
-                    (result_df[buy_col] - result_df[sell_col]) / total_amount
+            if buy_col in col_set and sell_col in col_set:
+                buy, sell = investor_df[buy_col], investor_df[sell_col]
+                new_cols[f"{investor_type}_net_buy_ratio"] = (
+                    (buy - sell) / (buy + sell)
                 ).fillna(0)
                 self.features_created.append(f"{investor_type}_net_buy_ratio")
 
         # 2. 투자자 간 상대적 강도
-        if all(
-            f"{inv}_net_buy_ratio" in result_df.columns
-            for inv in ["frgn", "prsn", "orgn"]
-        ):
+        ratio_cols = {f"{inv}_net_buy_ratio" for inv in ["frgn", "prsn", "orgn"]}
+        if new_cols.keys() >= ratio_cols:
             # 외국인 vs 개인
-            result_df["frgn_vs_prsn"] = (
-                result_df["frgn_net_buy_ratio"] - result_df["prsn_net_buy_ratio"]
+            new_cols["frgn_vs_prsn"] = (
+                new_cols["frgn_net_buy_ratio"] - new_cols["prsn_net_buy_ratio"]
             )
             # 외국인 vs 기관
-            result_df["frgn_vs_orgn"] = (
-                result_df["frgn_net_buy_ratio"] - result_df["orgn_net_buy_ratio"]
+            new_cols["frgn_vs_orgn"] = (
+                new_cols["frgn_net_buy_ratio"] - new_cols["orgn_net_buy_ratio"]
             )
             self.features_created.extend(["frgn_vs_prsn", "frgn_vs_orgn"])
 
         # 3. 투자자 행동의 이동평균 (트렌드 파악)
         for investor_type in ["frgn", "prsn", "orgn"]:
             ratio_col = f"{investor_type}_net_buy_ratio"
-            if ratio_col in result_df.columns:
+            if ratio_col in new_cols:
                 for window in [5, 10, 20]:
                     ma_col = f"{ratio_col}_ma_{window}"
-                    result_df[ma_col] = (
-                        result_df[ratio_col].rolling(window=window).mean()
-                    )
+                    new_cols[ma_col] = new_cols[ratio_col].rolling(window=window).mean()
                     self.features_created.append(ma_col)
 
-        return result_df
+        return _attach_columns(investor_df, new_cols)
 
     def create_lagged_features(
-        self, df: pd.DataFrame, columns: List[str], lags: List[int] = [1, 2, 3, 5]
+        self,
+        df: pd.DataFrame,
+        columns: List[str],
+        lags: List[int] = [1, 2, 3, 5],
+        dtype=np.float32,
     ) -> pd.DataFrame:
         """시차 피처 생성
 
@@ -177,57 +284,91 @@ class FeatureEngineer:
             df: 원본 DataFrame
             columns: 시차를 적용할 컬럼 리스트
             lags: 시차 기간 리스트
+            dtype: 숫자형 컬럼의 시차 피처 dtype. 기본값 float32는 유효숫자 약 7자리로
+                원본 값을 반올림하지만 메모리가 절반입니다 (원 정밀도는 np.float64).
 
         Returns:
             시차 피처가 추가된 DataFrame
         """
-        result_df = df.copy()
+        new_cols = {}
+        col_set = set(df.columns)
 
         for col in columns:
-            if col in result_df.columns:
-                for lag in lags:
-                    lag_col = f"{col}_lag_{lag}"
-                    result_df[lag_col] = result_df[col].shift(lag)
-                    self.features_created.append(lag_col)
-
-        return result_df
+            if col in col_set:
+                series = df[col]
+                if pd.api.types.is_numeric_dtype(
+                    series.dtype
+                ) and not pd.api.types.is_bool_dtype(series.dtype):
+                    # 컬럼별로 (행, 시차) 버퍼를 한 번 할당하고 슬라이스 복사로 채움
+                    values = series.to_numpy(dtype=dtype, na_value=np.nan)
+                    lagged = _lag_matrix(values, lags)
+                    for j, lag in enumerate(lags):
+                        new_cols[f"{col}_lag_{lag}"] = lagged[:, j]
+                else:
+                    for lag in lags:
+                        new_cols[f"{col}_lag_{lag}"] = series.shift(lag)
+                self.features_created.extend(f"{col}_lag_{lag}" for lag in lags)
+
+        return _attach_columns(df, new_cols)
 
     def create_rolling_statistics(
-        self, df: pd.DataFrame, columns: List[str], windows: List[int] = [5, 10, 20]
+        self,
+        df: pd.DataFrame,
+        columns: List[str],
+        windows: List[int] = [5, 10, 20],
+        dtype=np.float32,
     ) -> pd.DataFrame:
         """롤링 통계량 피처 생성
 
+        입력과 출력 행렬을 `dtype`으로 다루며, 커널 내부 누적은 항상 float64로 합니다.
+
         Args:
             df: 원본 DataFrame
             columns: 통계량을 계산할 컬럼 리스트
             windows: 롤링 윈도우 크기 리스트
+            dtype: 입력/결과 dtype. 기본값 float32는 입력을 유효숫자 약 7자리로
+                반올림하므로 값의 크기에 비해 변동이 매우 작은 컬럼의 표준편차는
+                부정확해질 수 있지만, 커널이 읽고 쓰는 메모리가 절반으로 줄어듭니다.
+                원 정밀도가 필요하면 np.float64를 지정합니다.
 
         Returns:
             롤링 통계량 피처가 추가된 DataFrame
         """
-        result_df = df.copy()
-
-        for col in columns:
-            if col in result_df.columns:
-                for window in windows:
-                    # 평균
-                    mean_col = f"{col}_mean_{window}"
-                    result_df[mean_col] = result_df[col].rolling(window=window).mean()
-                    self.features_created.append(mean_col)
-
-                    # 표준편차
-                    std_col = f"{col}_std_{window}"
-                    result_df[std_col] = result_df[col].rolling(window=window).std()
-                    self.features_created.append(std_col)
-
-                    # 최소값, 최대값
-                    min_col = f"{col}_min_{window}"
-                    max_col = f"{col}_max_{window}"
-                    result_df[min_col] = result_df[col].rolling(window=window).min()
-                    result_df[max_col] = result_df[col].rolling(window=window).max()
-                    self.features_created.extend([min_col, max_col])
-
-        return result_df
+        new_cols = {}
+        col_set = set(df.columns)
+        cols = [col for col in columns if col in col_set]
+        if not cols:
+            return df
+
+        # 대상 컬럼을 하나의 (행, 컬럼) 행렬로 모아 윈도우별로 컬럼 병렬 커널 호출
+        X = np.ascontiguousarray(df[cols].to_numpy(dtype=dtype, na_value=np.nan))
+        stats = {}
+        for window in windows:
+            outs = tuple(np.empty(X.shape, dtype=dtype) for _ in range(4))
+            batch_rolling(X, window, *outs)
+            stats[window] = outs
+
+        for j, col in enumerate(cols):
+            for window in windows:
+                out_mean, out_std, out_min, out_max = stats[window]
+                # 평균
+                mean_col = f"{col}_mean_{window}"
+                new_cols[mean_col] = out_mean[:, j]
+                self.features_created.append(mean_col)
+
+                # 표준편차 (pandas와 같은 표본 표준편차)
+                std_col = f"{col}_std_{window}"
+                new_cols[std_col] = out_std[:, j]
+                self.features_created.append(std_col)
+
+                # 최소값, 최대값
+                min_col = f"{col}_min_{window}"
+                max_col = f"{col}_max_{window}"
+                new_cols[min_col] = out_min[:, j]
+                new_cols[max_col] = out_max[:, j]
+                self.features_created.extend([min_col, max_col])
+
+        return _attach_columns(df, new_cols)
 
     def create_interaction_features(
         self, df: pd.DataFrame, feature_pairs: List[Tuple[str, str]]
@@ -241,23 +382,29 @@ class FeatureEngineer:
         Returns:
             상호작용 피처가 추가된 DataFrame
         """
-        result_df = df.copy()
+        new_cols = {}
+        col_set = set(df.columns)
 
         for feat1, feat2 in feature_pairs:
-            if feat1 in result_df.columns and feat2 in result_df.columns:
-                # 곱셈 상호작용
+            if feat1 in col_set and feat2 in col_set:
                 mult_col = f"{feat1}_x_{feat2}"
-                result_df[mult_col] = result_df[feat1] * result_df[feat2]
-                self.features_created.append(mult_col)
-
-                # 비율 상호작용
                 ratio_col = f"{feat1}_div_{feat2}"
-                result_df[ratio_col] = result_df[feat1] / (
-                    result_df[feat2] + 1e-8
-                )  # 0으로 나누기 방지
-                self.features_created.append(ratio_col)
-
-        return result_df
+                a = df[feat1].to_numpy()
+                b = df[feat2].to_numpy()
+                if a.dtype.kind == "f" and b.dtype.kind == "f":
+                    # 곱셈/비율 상호작용을 한 번의 순회로 계산 (0으로 나누기 방지 eps)
+                    out_dtype = np.result_type(a.dtype, b.dtype)
+                    mult = np.empty(len(a), dtype=out_dtype)
+                    ratio = np.empty(len(a), dtype=out_dtype)
+                    interact(a, b, mult, ratio, 1e-8)
+                    new_cols[mult_col] = mult
+                    new_cols[ratio_col] = ratio
+                else:
+                    new_cols[mult_col] = df[feat1] * df[feat2]
+                    new_cols[ratio_col] = df[feat1] / (df[feat2] + 1e-8)
+                self.features_created.extend([mult_col, ratio_col])
+
+        return _attach_columns(df, new_cols)
 
     def create_target_encoding(
         self, df: pd.DataFrame, categorical_cols: List[str], target_col: str
@@ -272,21 +419,33 @@ class FeatureEngineer:
         Returns:
             타겟 인코딩이 적용된 DataFrame
         """
-        result_df = df.copy()
+        if target_col not in df.columns:
+            logger.warning("Target column '%s' not found", target_col)
+            return df
 
-        if target_col not in result_df.columns:
-            print(f"Warning: Target column '{target_col}' not found")
-            return result_df
+        new_cols = {}
+        target = df[target_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        target_valid = ~np.isnan(target)
 
+        col_set = set(df.columns)
         for col in categorical_cols:
-            if col in result_df.columns:
-                # 각 카테고리의 평균 타겟값으로 인코딩
-                mean_target = result_df.groupby(col)[target_col].mean()
+            if col in col_set:
+                # 각 카테고리의 평균 타겟값으로 인코딩 (정수 코드 기준 bincount로 합/개수 계산)
+                codes, uniques = pd.factorize(df[col], sort=False)
+                valid = target_valid & (codes >= 0)
+                sums = np.bincount(
+                    codes[valid], weights=target[valid], minlength=len(uniques)
+                )
+                counts = np.bincount(codes[valid], minlength=len(uniques))
+                means = np.full(len(uniques) + 1, np.nan)
+                np.divide(sums, counts, out=means[:-1], where=counts > 0)
+
+                # 결측 카테고리(code=-1)는 마지막 NaN 항목을 가리킴
                 encoded_col = f"{col}_target_encoded"
-                result_df[encoded_col] = result_df[col].map(mean_target)
+                new_cols[encoded_col] = means[codes]
                 self.features_created.append(encoded_col)
 
-        return result_df
+        return _attach_columns(df, new_cols)
 
     def remove_highly_correlated_features(
         self, df: pd.DataFrame, threshold: float = 0.95
@@ -301,20 +460,18 @@ class FeatureEngineer:
             높은 상관관계 피처가 제거된 DataFrame
         """
         numeric_df = df.select_dtypes(include=[np.number])
-        corr_matrix = numeric_df.corr().abs()
+        corr = np.abs(_pairwise_corr(numeric_df.to_numpy(dtype=np.float64)))
 
-        # 상삼각 행렬만 고려 (중복 제거)
-        upper_tri = corr_matrix.where(
-            np.triu(np.ones(corr_matrix.shape), k=1).astype(bool)
-        )
+        # 상삼각 행렬만 고려 (중복 제거), NaN 상관계수는 비교 결과가 False
+        upper = np.triu(np.ones(corr.shape, dtype=bool), k=1)
+        with np.errstate(invalid="ignore"):
+            drop_mask = ((corr > threshold) & upper).any(axis=0)
 
         # 높은 상관관계를 가진 피처 찾기
-        to_drop = [
-            column for column in upper_tri.columns if any(upper_tri[column] > threshold)
-        ]
+        to_drop = numeric_df.columns[drop_mask].tolist()
 
         result_df = df.drop(columns=to_drop)
-        print(f"제거된 피처 ({len(to_drop)}개): {to_drop}")
+        logger.debug("제거된 피처 (%d개): %s", len(to_drop), to_drop)
 
         return result_df
 
@@ -411,13 +568,134 @@ def create_comprehensive_features(
     # 7. 높은 상관관계 피처 제거
     result_df = fe.remove_highly_correlated_features(result_df, threshold=0.95)
 
-    # 요약 정보 출력
-    summary = fe.get_feature_importance_summary()
-    print(f"✅ 피처 엔지니어링 완료!")
-    print(f"📊 총 생성된 피처: {summary['total_features_created']}개")
-    print(f"📈 기술적 지표: {summary['feature_categories']['technical_indicators']}개")
-    print(f"📉 변동성 피처: {summary['feature_categories']['volatility_features']}개")
-    print(f"👥 투자자 행동: {summary['feature_categories']['investor_behavior']}개")
-    print(f"⏰ 시차 피처: {summary['feature_categories']['lagged_features']}개")
+    # 요약 정보 로그 (DEBUG 레벨일 때만 요약 계산)
+    if logger.isEnabledFor(logging.DEBUG):
+        summary = fe.get_feature_importance_summary()
+        categories = summary["feature_categories"]
+        logger.debug("✅ 피처 엔지니어링 완료!")
+        logger.debug("📊 총 생성된 피처: %d개", summary["total_features_created"])
+        logger.debug("📈 기술적 지표: %d개", categories["technical_indicators"])
+        logger.debug("📉 변동성 피처: %d개", categories["volatility_features"])
+        logger.debug("👥 투자자 행동: %d개", categories["investor_behavior"])
+        logger.debug("⏰ 시차 피처: %d개", categories["lagged_features"])
 
     return result_df
+
+
+def create_comprehensive_features_pl(
+    price_df_pl: Any, price_col: str = "close"
+) -> pd.DataFrame:
+    """Polars LazyFrame 기반 종합 피처 엔지니어링 파이프라인
+
+    `create_comprehensive_features`의 가격 기반 단계(기술적 지표, 변동성, 시차,
+    롤링 통계량, 상호작용)를 하나의 LazyFrame 쿼리로 구성하여 Polars 최적화기가
+    연산을 묶어 멀티스레드로 실행하도록 합니다. 결과는 마지막에 한 번만 pandas로 변환한 뒤
+    높은 상관관계 피처를 제거합니다. 투자자 매매동향 병합은 포함하지 않습니다.
+
+    Args:
+        price_df_pl: 가격 데이터 (polars LazyFrame/DataFrame 또는 pandas DataFrame).
+            pandas DataFrame은 숫자 컬럼 버퍼를 복사하지 않고 공유하는 방식으로 변환됩니다.
+        price_col: 가격 컬럼명
+
+    Returns:
+        모든 피처가 적용된 DataFrame
+    """
+    import polars as pl
+
+    if isinstance(price_df_pl, pd.DataFrame):
+        # numpy 기반 숫자 컬럼은 Arrow 버퍼로 그대로 공유 (rechunk 시의 복사 생략)
+        price_df_pl = pl.from_pandas(price_df_pl, rechunk=False)
+
+    lf = price_df_pl.lazy()
+    price = pl.col(price_col)
+    columns = lf.collect_schema().names()
+
+    # pandas ewm과 같이 결측 위치에서는 직전 EMA 값을 유지
+    def ema(expr, span):
+        return expr.ewm_mean(span=span).forward_fill()
+
+    # 1. 기술적 지표 (SMA, EMA, RSI, 볼린저 밴드, MACD)
+    # RSI는 pandas 경로와 같은 Wilder 평활 커널 사용
+    rsi_14 = price.map_batches(
+        lambda s: pl.Series(
+            wilder_rsi(s.to_numpy().astype(np.float64, copy=False), 14)
+        ),
+        return_dtype=pl.Float64,
+    )
+    std_20 = price.rolling_std(20)
+    macd = ema(price, 12) - ema(price, 26)
+    lf = lf.with_columns(
+        [price.rolling_mean(w).alias(f"sma_{w}") for w in (5, 10, 20, 60)]
+        + [ema(price, w).alias(f"ema_{w}") for w in (5, 10, 20)]
+        + [
+            rsi_14.fill_nan(None).alias("rsi_14"),
+            (price.rolling_mean(20) + std_20 * 2).alias("bb_upper"),
+            (price.rolling_mean(20) - std_20 * 2).alias("bb_lower"),
+            macd.alias("macd"),
+            ema(macd, 9).alias("macd_signal"),
+        ]
+    )
+    bb_lower, bb_upper = pl.col("bb_lower"), pl.col("bb_upper")
+    lf = lf.with_columns(
+        ((price - bb_lower) / (bb_upper - bb_lower)).alias("bb_position"),
+        (pl.col("macd") - pl.col("macd_signal")).alias("macd_histogram"),
+    )
+
+    # 2. 변동성 피처
+    lf = lf.with_columns(
+        [price.pct_change(n).alias(f"return_{n}d") for n in (1, 5, 20)]
+    )
+    lf = lf.with_columns(
+        [
+            pl.col("return_1d").rolling_std(w).alias(f"volatility_{w}d")
+            for w in (5, 10, 20)
+        ]
+    )
+    if "high" in columns and "low" in columns:
+        price_range = (pl.col("high") - pl.col("low")) / price
+        lf = lf.with_columns(
+            price_range.alias("price_range"),
+            price_range.rolling_mean(20).alias("price_range_ma"),
+        )
+
+    # 3. 시차 피처
+    key_features = ["return_1d", "rsi_14", "volatility_5d", "macd"]
+    lf = lf.with_columns(
+        [
+            pl.col(col).shift(lag).alias(f"{col}_lag_{lag}")
+            for col in key_features
+            for lag in (1, 2, 3, 5)
+        ]
+    )
+
+    # 4. 롤링 통계량
+    rolling_exprs = []
+    for col in ["return_1d", "volatility_5d"]:
+        for w in (5, 10, 20):
+            rolling_exprs += [
+                pl.col(col).rolling_mean(w).alias(f"{col}_mean_{w}"),
+                pl.col(col).rolling_std(w).alias(f"{col}_std_{w}"),
+                pl.col(col).rolling_min(w).alias(f"{col}_min_{w}"),
+                pl.col(col).rolling_max(w).alias(f"{col}_max_{w}"),
+            ]
+    lf = lf.with_columns(rolling_exprs)
+
+    # 5. 상호작용 피처
+    interaction_exprs = []
+    for feat1, feat2 in [
+        ("return_1d", "volatility_5d"),
+        ("rsi_14", "bb_position"),
+        ("sma_5", "sma_20"),
+    ]:
+        interaction_exprs += [
+            (pl.col(feat1) * pl.col(feat2)).alias(f"{feat1}_x_{feat2}"),
+            (pl.col(feat1) / (pl.col(feat2) + 1e-8)).alias(f"{feat1}_div_{feat2}"),
+        ]
+    lf = lf.with_columns(interaction_exprs)
+
+    # 쿼리 실행 후 pandas로 한 번만 변환 (null -> NaN)
+    result_df = lf.collect(engine="streaming").to_pandas()
+
+    # 6. 높은 상관관계 피처 제거
+    fe = FeatureEngineer()
+    return fe.remove_highly_correlated_features(result_df, threshold=0.95)
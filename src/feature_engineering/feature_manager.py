@@ -10,17 +10,39 @@
 """
 
 import os
-import yaml
 import logging
 import importlib
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Union, Type
 
 from src.feature_engineering.abstract_feature import Feature
-from src.data_collection.api_client import APIClient
+from src.data_collection.api_client import get_shared_api_client
+from src.utils.config_loader import load_yaml
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _import_feature_class_cached(class_path: str) -> Type[Feature]:
+    """클래스 경로로 피처 클래스를 로드 (경로별 결과 캐시)
+
+    Args:
+        class_path: 모듈 경로와 클래스 이름
+
+    Returns:
+        Type[Feature]: 로드된 피처 클래스
+
+    Raises:
+        ImportError, AttributeError, ValueError: 모듈이나 클래스를 찾을 수 없는 경우 (캐시되지 않음)
+    """
+    # 모듈 경로와 클래스 이름 분리
+    module_path, class_name = class_path.rsplit(".", 1)
+
+    # 모듈 동적 로드 후 클래스 가져오기
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
 class FeatureManager:
     """피처 관리자 클래스
 
@@ -34,6 +56,7 @@ class FeatureManager:
         params_yaml_path: str = "config/params.yaml",
         api_config_yaml_path: str = "config/api_config.yaml",
         api_schema_file_path: str = None,
+        preload: bool = True,
     ):
         """FeatureManager 생성자
 
@@ -42,6 +65,8 @@ class FeatureManager:
             params_yaml_path: 파라미터 설정 파일 경로
             api_config_yaml_path: API 설정 파일 경로
             api_schema_file_path: API 스키마 파일 경로
+            preload: True면 생성 시 모든 피처를 로드하고, False면 처음 조회될 때
+                해당 피처의 클래스를 import하여 인스턴스를 생성
         """
         self.features_yaml_path = features_yaml_path
         self.params_yaml_path = params_yaml_path
@@ -56,8 +81,8 @@ class FeatureManager:
         # 원래 방식으로 다시 변경합니다
         script_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
-        self.api_client = APIClient(
-            api_config=self.api_config,
+        self.api_client = get_shared_api_client(
+            self.api_config,
             schema_file_path=os.path.join(
                 project_root, "hantu_api_docs", "response_api.json"
             ),
@@ -65,9 +90,11 @@ class FeatureManager:
 
         # 피처 인스턴스 저장 딕셔너리
         self.features: Dict[str, Feature] = {}
+        # 아직 생성하지 않은 피처 설정 (피처 이름 -> 피처 설정)
+        self._pending: Dict[str, Dict] = {}
 
         # 피처 초기화
-        self._initialize_features()
+        self._initialize_features(preload)
 
     def _load_yaml(self, file_path: str) -> Dict:
         """YAML 설정 파일 로드
@@ -78,83 +105,97 @@ class FeatureManager:
         Returns:
             Dict: 로드된 설정 정보
         """
-        if not os.path.exists(file_path):
-            logger.warning(f"설정 파일이 존재하지 않습니다: {file_path}")
-            return {}
+        return load_yaml(file_path)
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
-            logger.info(f"설정 파일 로드 성공: {file_path}")
-            return config
-        except Exception as e:
-            logger.error(f"설정 파일 로드 중 오류 발생: {file_path}, {str(e)}")
-            return {}
+    def _initialize_features(self, preload: bool = True):
+        """features.yaml 설정에 따라 피처 객체 초기화
 
-    def _initialize_features(self):
-        """features.yaml 설정에 따라 피처 객체 초기화"""
+        Args:
+            preload: False면 피처 설정만 등록하고 인스턴스 생성은 첫 조회 시로 미룸
+        """
         if not self.features_config or "features" not in self.features_config:
             logger.warning("피처 설정을 찾을 수 없습니다.")
             return
 
-        for feature_name, feature_config in self.features_config["features"].items():
-            try:
-                # 피처 클래스 로드 - 여러 형식 지원
-                feature_class = None
+        self._pending.update(self.features_config["features"])
+        if preload:
+            self._load_pending_features()
 
-                # 기존 방식 (class 키 사용)
-                if "class" in feature_config:
-                    feature_class = self._import_feature_class(
-                        feature_config.get("class", "")
-                    )
+    def _load_pending_features(self):
+        """아직 생성하지 않은 모든 피처 인스턴스 생성"""
+        for feature_name in list(self._pending):
+            self._load_feature(feature_name)
 
-                # 새로운 방식 (module_path와 feature_class 키 사용)
-                elif (
-                    "module_path" in feature_config
-                    and "feature_class" in feature_config
-                ):
-                    module_path = feature_config.get("module_path", "")
-                    class_name = feature_config.get("feature_class", "")
-                    feature_class = self._import_feature_class(
-                        f"{module_path}.{class_name}"
-                    )
+    def _load_feature(self, feature_name: str) -> Optional[Feature]:
+        """등록된 피처 설정으로 피처 클래스를 로드하고 인스턴스 생성
+
+        Args:
+            feature_name: 피처 이름
+
+        Returns:
+            Optional[Feature]: 생성된 피처 인스턴스 (실패 시 None)
+        """
+        feature_config = self._pending.pop(feature_name, None)
+        if feature_config is None:
+            return self.features.get(feature_name)
 
-                if not feature_class:
-                    logger.error(f"피처 클래스를 로드할 수 없습니다: {feature_name}")
-                    continue
-
-                # 파라미터 설정 로드
-                param_key = feature_config.get("param_key", "")
-                params = self.params_config.get(param_key, {}) if param_key else {}
-
-                # 코드 리스트 설정
-                code_list = feature_config.get("code_list", [])
-                # config에 code_list가 없으면 params에서 가져옴
-                if not code_list and "code_list" in params:
-                    code_list = params.get("code_list", [])
-
-                    # API 설정 추가
-                if "api_config" not in params:
-                    params["api_config"] = self.api_config
-
-                # 피처 인스턴스 생성 (기본 파라미터만 전달)
-                feature_instance = feature_class(
-                    _feature_name=feature_name,
-                    _code_list=code_list,
-                    _feature_query=self.api_client,
-                    _quote_connect=False,
-                    _params=params,
+        try:
+            # 피처 클래스 로드 - 여러 형식 지원
+            feature_class = None
+
+            # 기존 방식 (class 키 사용)
+            if "class" in feature_config:
+                feature_class = self._import_feature_class(
+                    feature_config.get("class", "")
                 )
 
-                # 피처 리스트에 추가
-                self.features[feature_name] = feature_instance
-                logger.info(f"피처 초기화 성공: {feature_name}")
+            # 새로운 방식 (module_path와 feature_class 키 사용)
+            elif "module_path" in feature_config and "feature_class" in feature_config:
+                module_path = feature_config.get("module_path", "")
+                class_name = feature_config.get("feature_class", "")
+                feature_class = self._import_feature_class(
+                    f"{module_path}.{class_name}"
+                )
 
-            except Exception as e:
-                logger.error(f"피처 초기화 중 오류 발생: {feature_name}, {str(e)}")
-                import traceback
+            if not feature_class:
+                logger.error(f"피처 클래스를 로드할 수 없습니다: {feature_name}")
+                return None
+
+            # 파라미터 설정 로드
+            param_key = feature_config.get("param_key", "")
+            # 캐시된 설정이 수정되지 않도록 피처별 사본 사용
+            params = dict(self.params_config.get(param_key, {})) if param_key else {}
+
+            # 코드 리스트 설정
+            code_list = feature_config.get("code_list", [])
+            # config에 code_list가 없으면 params에서 가져옴
+            if not code_list and "code_list" in params:
+                code_list = params.get("code_list", [])
+
+                # API 설정 추가
+            if "api_config" not in params:
+                params["api_config"] = self.api_config
+
+            # 피처 인스턴스 생성 (기본 파라미터만 전달)
+            feature_instance = feature_class(
+                _feature_name=feature_name,
+                _code_list=code_list,
+                _feature_query=self.api_client,
+                _quote_connect=False,
+                _params=params,
+            )
+
+            # 피처 리스트에 추가
+            self.features[feature_name] = feature_instance
+            logger.info(f"피처 초기화 성공: {feature_name}")
+            return feature_instance
 
-                logger.error(traceback.format_exc())
+        except Exception as e:
+            logger.error(f"피처 초기화 중 오류 발생: {feature_name}, {str(e)}")
+            import traceback
+
+            logger.error(traceback.format_exc())
+            return None
 
     def _import_feature_class(self, class_path: str) -> Optional[Type[Feature]]:
         """클래스 경로를 기반으로 피처 클래스 동적 로드
@@ -169,16 +210,7 @@ class FeatureManager:
             return None
 
         try:
-            # 모듈 경로와 클래스 이름 분리
-            module_path, class_name = class_path.rsplit(".", 1)
-
-            # 모듈 동적 로드
-            module = importlib.import_module(module_path)
-
-            # 클래스 가져오기
-            feature_class = getattr(module, class_name)
-
-            return feature_class
+            return _import_feature_class_cached(class_path)
         except (ImportError, AttributeError, ValueError) as e:
             logger.error(f"피처 클래스 로드 중 오류 발생: {class_path}, {str(e)}")
             return None
@@ -192,7 +224,10 @@ class FeatureManager:
         Returns:
             Optional[Feature]: 해당 이름의 피처 인스턴스
         """
-        return self.features.get(feature_name)
+        feature = self.features.get(feature_name)
+        if feature is None and feature_name in self._pending:
+            feature = self._load_feature(feature_name)
+        return feature
 
     def get_all_features(self) -> Dict[str, Feature]:
         """모든 피처 인스턴스 반환
@@ -200,6 +235,7 @@ class FeatureManager:
         Returns:
             Dict[str, Feature]: 피처 이름을 키로 하는 피처 인스턴스 딕셔너리
         """
+        self._load_pending_features()
         return self.features
 
     def call_feature(self, feature_name: str, **kwargs) -> Any:
@@ -266,9 +302,10 @@ class FeatureManager:
             처리 결과 (피처별)
         """
         results = {}
+        self._load_pending_features()
 
         for feature_name, feature in self.features.items():
-            if feature.inquiry and time_str in feature.inquiry_time_list:
+            if feature.inquiry and feature.is_inquiry_time(time_str):
                 try:
                     logger.info(
                         f"Triggering inquiry for feature '{feature_name}' at time {time_str}"
@@ -290,6 +327,7 @@ class FeatureManager:
             피처별 상태 정보
         """
         health_status = {}
+        self._load_pending_features()
 
         for feature_name, feature in self.features.items():
             try:
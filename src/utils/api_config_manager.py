@@ -4,14 +4,146 @@ API 설정 관리 유틸리티
 YAML 파일에서 API 설정을 로드하고 관리하는 클래스
 """
 
-import yaml
 import re
+import sys
+import threading
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Any,
+    Optional,
+    List,
+    Tuple,
+    Callable,
+    NamedTuple,
+    Iterable,
+    Union,
+    TYPE_CHECKING,
+)
 import logging
 
+from src.utils.config_loader import load_yaml
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# 콜/풋에 따라 스키마가 나뉘는 API와 해당 상품 유형
+_WEEKLY_OPTION_API = "위클리옵션시세"
+_CALL_OPTION_TYPES = frozenset({"call_weekly", "call_monthly"})
+_PUT_OPTION_TYPES = frozenset({"put_weekly", "put_monthly"})
+
+# 설정 파일에 없을 때 반환하는 읽기 전용 기본값 (호출마다 새 딕셔너리를 만들지 않음)
+_DEFAULT_ERROR_CONFIG = MappingProxyType(
+    {"max_retries": 3, "retry_delay": 1.0, "timeout": 30}
+)
+_DEFAULT_LOGGING_CONFIG = MappingProxyType(
+    {
+        "level": "WARNING",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "file_prefix": "data_collector",
+    }
+)
+_EMPTY_API_PARAMETERS = MappingProxyType({"required": (), "optional": ()})
+
+# API별 파라미터 구성 여부 비트 (build_api_params에서 확인하는 항목만)
+_BIT_DATE_1_REQUIRED = 1 << 0  # required에 FID_INPUT_DATE_1
+_BIT_DATE_2_REQUIRED = 1 << 1  # required에 FID_INPUT_DATE_2
+_BIT_DATE_2_OPTIONAL = 1 << 2  # optional에 FID_INPUT_DATE_2
+_BIT_MARKET_CODE = 1 << 3  # optional에 FID_COND_MRKT_DIV_CODE
+_BIT_PERIOD_CODE = 1 << 4  # optional에 FID_PERIOD_DIV_CODE
+
+# 번호 역참조(\1)는 그룹을 감싸면 번호가 바뀌므로 이런 패턴은 합치지 않음
+_BACKREF_RE = re.compile(r"\\[1-9]")
+
+
+def _pattern_matcher(pattern: "re.Pattern") -> Callable[[str], Any]:
+    """패턴의 매칭 함수 선택
+
+    끝이 `$`/`\\Z`로 고정된 패턴은 종목코드 전체와 일치해야 한다는 의도이므로
+    `fullmatch`를 사용해 문자열 끝을 넘어선 탐색 없이 바로 실패하도록 합니다.
+    그 외 패턴은 기존과 같이 접두 일치(`match`)를 사용합니다.
+    """
+    text = pattern.pattern
+    anchored = text.endswith("\\Z") or (text.endswith("$") and not text.endswith("\\$"))
+    return pattern.fullmatch if anchored else pattern.match
+
+
+def _intern_keys(mapping: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """문자열 키를 intern한 새 dict 반환 (None이면 빈 dict)"""
+    if not mapping:
+        return {}
+    return {
+        sys.intern(key) if isinstance(key, str) else key: value
+        for key, value in mapping.items()
+    }
+
+
+def _intern_param_template(template: Any) -> Any:
+    """API 파라미터 템플릿의 required/optional 파라미터 이름을 intern한 사본 반환"""
+    if not isinstance(template, dict):
+        return template
+    interned = dict(template)
+    for key in ("required", "optional"):
+        names = template.get(key)
+        if isinstance(names, list):
+            interned[key] = [
+                sys.intern(name) if isinstance(name, str) else name for name in names
+            ]
+    return interned
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """종목코드별로 한 번만 계산하는 조회 결과 묶음"""
+
+    symbol_type: str  # 상품 유형 (get_symbol_type 결과)
+    market_code: str  # 시장분류코드
+    period_code: str  # 기본 기간분류코드 (일별)
+    weekly_option_schema: Optional[str] = None  # 위클리옵션시세의 콜/풋 스키마 이름
+
+
+class ApiParams(NamedTuple):
+    """
+    KIS API 기본 요청 파라미터 묶음
+
+    튜플 기반이라 dict보다 작고 필드 접근이 고정 위치 조회입니다.
+    HTTP 요청 직전에만 as_dict()로 dict로 변환합니다.
+    """
+
+    FID_INPUT_ISCD: str  # 종목코드
+    FID_INPUT_DATE_1: Optional[str] = None  # 시작일
+    FID_INPUT_DATE_2: Optional[str] = None  # 종료일 (분봉은 단일 날짜)
+    FID_COND_MRKT_DIV_CODE: Optional[str] = None  # 시장분류코드
+    FID_PERIOD_DIV_CODE: Optional[str] = None  # 기간분류코드
+
+    def as_dict(self) -> Dict[str, str]:
+        """설정된(None이 아닌) 파라미터만 필드 순서대로 dict로 변환"""
+        return {
+            name: value
+            for name, value in zip(_API_PARAM_FIELDS, self)
+            if value is not None
+        }
+
+
+# as_dict에서 사용하는 필드 이름 튜플 (미리 계산)
+_API_PARAM_FIELDS = ApiParams._fields
+
+
+class _CompiledPatterns(NamedTuple):
+    """컴파일된 종목코드 패턴 묶음 (설정 로드 후 첫 판별 시 생성)"""
+
+    futures: List[Tuple[str, Callable]]  # (선물 유형, 매칭 함수) - 설정 순서 유지
+    options: List[Tuple[str, Callable]]  # (옵션 유형, 매칭 함수) - 설정 순서 유지
+    call: List[Callable]  # 콜옵션 매칭 함수
+    put: List[Callable]  # 풋옵션 매칭 함수
+    labels: Dict[str, str]  # 합친 패턴의 그룹 이름 -> 상품 유형
+    match: Optional[Callable]  # 합친 패턴의 매칭 함수 (합칠 수 없으면 None)
+
 
 class ApiConfigManager:
     """API 설정 관리 클래스"""
@@ -25,20 +157,136 @@ class ApiConfigManager:
         """
         self.config_path = Path(config_path)
         self.config = self._load_config()
+        self._prepare_config()
 
     def _load_config(self) -> Dict[str, Any]:
-        """설정 파일 로드"""
-        try:
-            with open(self.config_path, "r", encoding="utf-8") as file:
-                config = yaml.safe_load(file)
-                logger.info(f"API 설정 로드 완료: {self.config_path}")
-                return config
-        except FileNotFoundError:
-            logger.error(f"설정 파일을 찾을 수 없습니다: {self.config_path}")
-            return {}
-        except yaml.YAMLError as e:
-            logger.error(f"YAML 파싱 오류: {e}")
-            return {}
+        """설정 파일 로드
+
+        파일이 바뀌지 않았다면 `load_yaml`의 캐시(mtime + 크기 기준)를 재사용하므로
+        `reload_config`도 재파싱하지 않습니다. 반환된 설정은 다른 로더와 공유되므로 수정하지 않습니다.
+        """
+        return load_yaml(str(self.config_path))
+
+    def _prepare_config(self):
+        """로드된 설정으로 조회용 자료구조를 만들고 캐시 초기화"""
+        self._bind_sections()
+        # 패턴은 첫 종목 판별 시 컴파일 (설정 변경 시 이전 결과 폐기)
+        self.__dict__.pop("_patterns", None)
+        self._build_param_bits()
+        self._reset_caches()
+
+    def _bind_sections(self):
+        """자주 조회하는 설정 섹션을 속성으로 보관 (조회마다 섹션을 다시 찾지 않음)"""
+        config = self.config
+        # API 이름 키를 intern하여 코드의 문자열 상수와 동일 객체로 비교되도록 함
+        # (config는 load_yaml 캐시와 공유되므로 원본을 수정하지 않고 새 dict 생성)
+        self._tr_ids = _intern_keys(config.get("tr_ids"))
+        self._endpoints = _intern_keys(config.get("api_endpoints"))
+        self._schemas = _intern_keys(config.get("data_schemas"))
+        self._params = {
+            api_name: _intern_param_template(template)
+            for api_name, template in _intern_keys(
+                config.get("api_parameters")
+            ).items()
+        }
+        self._symbol_patterns = config.get("symbol_patterns") or {}
+        self._market_codes = config.get("market_codes") or {}
+        self._period_codes = config.get("period_codes") or {}
+        self._error_cfg = config.get("error_handling", _DEFAULT_ERROR_CONFIG)
+        self._logging_cfg = config.get("logging", _DEFAULT_LOGGING_CONFIG)
+
+    def _build_param_bits(self):
+        """API별 필수/선택 파라미터 구성을 비트마스크로 변환 (조회 1회 + 비트 검사)"""
+        self._param_bits = {}
+        for api_name, template in self._params.items():
+            required = frozenset(template.get("required") or [])
+            optional = frozenset(template.get("optional") or [])
+            bits = 0
+            if "FID_INPUT_DATE_1" in required:
+                bits |= _BIT_DATE_1_REQUIRED
+            if "FID_INPUT_DATE_2" in required:
+                bits |= _BIT_DATE_2_REQUIRED
+            if "FID_INPUT_DATE_2" in optional:
+                bits |= _BIT_DATE_2_OPTIONAL
+            if "FID_COND_MRKT_DIV_CODE" in optional:
+                bits |= _BIT_MARKET_CODE
+            if "FID_PERIOD_DIV_CODE" in optional:
+                bits |= _BIT_PERIOD_CODE
+            self._param_bits[api_name] = bits
+
+    @cached_property
+    def _patterns(self) -> _CompiledPatterns:
+        """컴파일된 종목코드 패턴 (첫 사용 시 한 번만 컴파일)"""
+        return self._compile_patterns()
+
+    def _compile_patterns(self) -> _CompiledPatterns:
+        """종목코드 패턴 컴파일"""
+        patterns = self._symbol_patterns
+
+        def compile_group(group: Dict[str, str]) -> List[tuple]:
+            compiled = []
+            for name, pattern in group.items():
+                if not pattern:
+                    continue
+                try:
+                    compiled.append((name, re.compile(pattern)))
+                except re.error as e:
+                    logger.error(f"종목코드 패턴 컴파일 오류: {name}={pattern}, {e}")
+            return compiled
+
+        futures_patterns = compile_group(patterns.get("futures", {}))
+        option_patterns = compile_group(patterns.get("options", {}))
+
+        # (유형, 매칭 함수) 목록 - 설정 파일의 순서 유지
+        futures = [(name, _pattern_matcher(p)) for name, p in futures_patterns]
+        options = [(name, _pattern_matcher(p)) for name, p in option_patterns]
+
+        option_matchers = dict(options)
+        call = [
+            option_matchers[name]
+            for name in ("call_weekly", "call_monthly")
+            if name in option_matchers
+        ]
+        put = [
+            option_matchers[name]
+            for name in ("put_weekly", "put_monthly")
+            if name in option_matchers
+        ]
+
+        # 모든 패턴을 이름 있는 그룹의 alternation 하나로 합쳐 한 번의 match로 판별
+        # (선물 -> 옵션 순서이므로 먼저 일치하는 패턴이 우선하는 기존 규칙과 동일)
+        labels = {}
+        alternatives = []
+        labeled = [(f"futures_{name}", p) for name, p in futures_patterns]
+        labeled += option_patterns
+        for i, (label, pattern) in enumerate(labeled):
+            group = f"_p{i}"
+            labels[group] = label
+            alternatives.append(f"(?P<{group}>{pattern.pattern})")
+        symbol_match = None
+        if labeled and not any(_BACKREF_RE.search(p.pattern) for _, p in labeled):
+            try:
+                combined = re.compile("|".join(alternatives))
+            except re.error:
+                # 인라인 플래그 등으로 합칠 수 없으면 개별 패턴을 순서대로 검사
+                combined = None
+            if combined is not None:
+                # 모든 패턴이 끝까지 고정되어 있으면 합친 패턴도 fullmatch로 검사
+                all_anchored = all(
+                    _pattern_matcher(p) == p.fullmatch for _, p in labeled
+                )
+                symbol_match = combined.fullmatch if all_anchored else combined.match
+
+        return _CompiledPatterns(futures, options, call, put, labels, symbol_match)
+
+    def _reset_caches(self):
+        """설정에 의존하는 조회 결과 캐시 초기화 (설정 로드 시마다 호출)"""
+        # 같은 종목코드/상품 유형이 반복 조회되므로 인스턴스별 LRU 캐시 사용
+        self._symbol_type_cache = lru_cache(maxsize=4096)(self._get_symbol_type_impl)
+        self._market_code_cache = lru_cache(maxsize=64)(self._get_market_code_impl)
+        self._symbol_info_cache = lru_cache(maxsize=4096)(self._get_symbol_info_impl)
+        self._option_flags_cache = lru_cache(maxsize=4096)(self._get_option_flags_impl)
+        self._base_params_cache = lru_cache(maxsize=2048)(self._build_base_params)
 
     def get_tr_id(self, api_name: str) -> str:
         """
@@ -50,8 +298,7 @@ class ApiConfigManager:
         Returns:
             str: TR ID
         """
-        tr_ids = self.config.get("tr_ids", {})
-        return tr_ids.get(api_name, "FHKIF03020100")  # 기본값
+        return self._tr_ids.get(api_name, "FHKIF03020100")  # 기본값
 
     def get_api_endpoint(self, api_name: str) -> str:
         """
@@ -63,8 +310,7 @@ class ApiConfigManager:
         Returns:
             str: API 엔드포인트
         """
-        endpoints = self.config.get("api_endpoints", {})
-        return endpoints.get(api_name, "")
+        return self._endpoints.get(api_name, "")
 
     def get_data_schema(self, api_name: str, symbol_code: str = None) -> Dict[str, Any]:
         """
@@ -77,14 +323,13 @@ class ApiConfigManager:
         Returns:
             Dict[str, Any]: 데이터 스키마 정보
         """
-        schemas = self.config.get("data_schemas", {})
+        schemas = self._schemas
 
-        # 위클리옵션의 경우 콜/풋 구분
-        if api_name == "위클리옵션시세" and symbol_code:
-            if self.is_call_option(symbol_code):
-                return schemas.get("위클리옵션시세_콜옵션", {})
-            elif self.is_put_option(symbol_code):
-                return schemas.get("위클리옵션시세_풋옵션", {})
+        # 위클리옵션의 경우 콜/풋 구분 (종목별로 캐시된 스키마 이름 사용)
+        if symbol_code and api_name == _WEEKLY_OPTION_API:
+            schema_name = self.get_symbol_info(symbol_code).weekly_option_schema
+            if schema_name:
+                return schemas.get(schema_name, {})
 
         return schemas.get(api_name, {})
 
@@ -96,33 +341,24 @@ class ApiConfigManager:
             api_name (str): API 이름
 
         Returns:
-            Dict[str, List[str]]: 필수/선택 파라미터 목록
+            Dict[str, List[str]]: 필수/선택 파라미터 목록 (템플릿이 없으면 읽기 전용 빈 목록)
         """
-        parameters = self.config.get("api_parameters", {})
-        return parameters.get(api_name, {"required": [], "optional": []})
+        return self._params.get(api_name, _EMPTY_API_PARAMETERS)
 
     def is_call_option(self, symbol_code: str) -> bool:
         """콜옵션 여부 확인"""
-        patterns = self.config.get("symbol_patterns", {}).get("options", {})
-        call_patterns = [
-            patterns.get("call_weekly", ""),
-            patterns.get("call_monthly", ""),
-        ]
-
-        for pattern in call_patterns:
-            if pattern and re.match(pattern, symbol_code):
-                return True
-        return False
+        return self._option_flags_cache(symbol_code)[0]
 
     def is_put_option(self, symbol_code: str) -> bool:
         """풋옵션 여부 확인"""
-        patterns = self.config.get("symbol_patterns", {}).get("options", {})
-        put_patterns = [patterns.get("put_weekly", ""), patterns.get("put_monthly", "")]
+        return self._option_flags_cache(symbol_code)[1]
 
-        for pattern in put_patterns:
-            if pattern and re.match(pattern, symbol_code):
-                return True
-        return False
+    def _get_option_flags_impl(self, symbol_code: str) -> Tuple[bool, bool]:
+        """콜/풋 패턴 일치 여부를 한 번에 판별 (캐시되지 않은 경로)"""
+        patterns = self._patterns
+        is_call = any(match(symbol_code) for match in patterns.call)
+        is_put = any(match(symbol_code) for match in patterns.put)
+        return is_call, is_put
 
     def get_symbol_type(self, symbol_code: str) -> str:
         """
@@ -134,23 +370,96 @@ class ApiConfigManager:
         Returns:
             str: 상품 유형 (futures, call_option, put_option, unknown)
         """
-        patterns = self.config.get("symbol_patterns", {})
+        return self._symbol_type_cache(symbol_code)
+
+    def classify_symbols(
+        self, symbol_codes: Union["pd.Series", Iterable[str]]
+    ) -> Union["pd.Series", List[str]]:
+        """
+        여러 종목코드의 상품 유형을 한 번에 판별
+
+        고유 종목코드만 패턴 매칭한 뒤 해시 매핑으로 전체에 펼치므로,
+        행마다 get_symbol_type을 호출하는 apply보다 빠릅니다.
+
+        Args:
+            symbol_codes (Union[pd.Series, Iterable[str]]): 종목코드 Series 또는 목록
+
+        Returns:
+            Union[pd.Series, List[str]]: 상품 유형 (입력이 Series면 같은 인덱스의
+                Series, 그 외에는 list). 문자열이 아닌 값은 unknown
+        """
+        import pandas as pd  # Series 입력 시에만 필요 (설정 조회만 하는 경우 import 생략)
+
+        if isinstance(symbol_codes, pd.Series):
+            types = {
+                code: self._classify_one(code) for code in symbol_codes.unique()
+            }
+            return symbol_codes.map(types).fillna("unknown").astype(object)
+
+        codes = list(symbol_codes)
+        types = {code: self._classify_one(code) for code in set(codes)}
+        return [types[code] for code in codes]
+
+    def _classify_one(self, symbol_code: Any) -> str:
+        """문자열이 아닌 값(NaN 등)은 unknown으로 처리하는 get_symbol_type"""
+        if not isinstance(symbol_code, str):
+            return "unknown"
+        return self._symbol_type_cache(symbol_code)
+
+    def _get_symbol_type_impl(self, symbol_code: str) -> str:
+        """종목코드 패턴 매칭으로 상품 유형 판별 (캐시되지 않은 경로)"""
+        patterns = self._patterns
+        if patterns.match is not None:
+            match = patterns.match(symbol_code)
+            return patterns.labels[match.lastgroup] if match else "unknown"
 
         # 선물 확인
-        for futures_type, pattern in patterns.get("futures", {}).items():
-            if re.match(pattern, symbol_code):
+        for futures_type, match in patterns.futures:
+            if match(symbol_code):
                 return f"futures_{futures_type}"
 
         # 옵션 확인
-        for option_type, pattern in patterns.get("options", {}).items():
-            if re.match(pattern, symbol_code):
+        for option_type, match in patterns.options:
+            if match(symbol_code):
                 return option_type
 
         return "unknown"
 
+    def get_symbol_info(self, symbol_code: str) -> SymbolInfo:
+        """
+        종목코드의 상품 유형, 시장코드, 기본 기간코드, 위클리옵션 스키마를 한 번에 조회
+
+        Args:
+            symbol_code (str): 종목코드
+
+        Returns:
+            SymbolInfo: 종목별로 캐시된 조회 결과
+        """
+        return self._symbol_info_cache(symbol_code)
+
+    def _get_symbol_info_impl(self, symbol_code: str) -> SymbolInfo:
+        """종목코드 조회 결과 묶음 생성 (캐시되지 않은 경로)"""
+        symbol_type = self.get_symbol_type(symbol_code)
+        if symbol_type in _CALL_OPTION_TYPES:
+            weekly_option_schema = "위클리옵션시세_콜옵션"
+        elif symbol_type in _PUT_OPTION_TYPES:
+            weekly_option_schema = "위클리옵션시세_풋옵션"
+        else:
+            weekly_option_schema = None
+        return SymbolInfo(
+            symbol_type=symbol_type,
+            market_code=self.get_market_code(symbol_type),
+            period_code=self.get_period_code("일별"),
+            weekly_option_schema=weekly_option_schema,
+        )
+
     def get_market_code(self, symbol_type: str) -> str:
         """상품 유형으로 시장코드 조회"""
-        market_codes = self.config.get("market_codes", {})
+        return self._market_code_cache(symbol_type)
+
+    def _get_market_code_impl(self, symbol_type: str) -> str:
+        """상품 유형으로 시장코드 조회 (캐시되지 않은 경로)"""
+        market_codes = self._market_codes
 
         # 연속 선물의 경우 특별 처리 - F 코드 사용
         if symbol_type == "futures_continuous":
@@ -166,25 +475,15 @@ class ApiConfigManager:
 
     def get_period_code(self, period_type: str) -> str:
         """기간 유형으로 기간코드 조회"""
-        period_codes = self.config.get("period_codes", {})
-        return period_codes.get(period_type, "D")
+        return self._period_codes.get(period_type, "D")
 
     def get_error_config(self) -> Dict[str, Any]:
         """오류 처리 설정 조회"""
-        return self.config.get(
-            "error_handling", {"max_retries": 3, "retry_delay": 1.0, "timeout": 30}
-        )
+        return self._error_cfg
 
     def get_logging_config(self) -> Dict[str, Any]:
         """로깅 설정 조회"""
-        return self.config.get(
-            "logging",
-            {
-                "level": "WARNING",
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "file_prefix": "data_collector",
-            },
-        )
+        return self._logging_cfg
 
     def build_api_params(
         self,
@@ -207,32 +506,66 @@ class ApiConfigManager:
         Returns:
             Dict[str, str]: 구성된 API 파라미터
         """
-        param_template = self.get_api_parameters(api_name)
-        symbol_type = self.get_symbol_type(symbol_code)
+        # 같은 (API, 종목, 기간) 조합은 캐시된 기본 파라미터를 dict로 변환해서 사용
+        params = self._base_params_cache(
+            api_name, symbol_code, start_date, end_date
+        ).as_dict()
 
-        # 기본 파라미터 설정
-        params = {"FID_INPUT_ISCD": symbol_code}
+        # 추가 파라미터 병합
+        params.update(additional_params)
 
-        # 날짜 파라미터 추가
-        if start_date and "FID_INPUT_DATE_1" in param_template.get("required", []):
-            params["FID_INPUT_DATE_1"] = start_date
+        return params
 
-        if end_date and "FID_INPUT_DATE_2" in param_template.get("required", []):
-            params["FID_INPUT_DATE_2"] = end_date
-        elif start_date and "FID_INPUT_DATE_2" in param_template.get("optional", []):
-            params["FID_INPUT_DATE_2"] = start_date  # 분봉의 경우 단일 날짜
+    def _build_base_params(
+        self, api_name: str, symbol_code: str, start_date: str, end_date: str
+    ) -> ApiParams:
+        """추가 파라미터를 제외한 API 파라미터 구성 (캐시되지 않은 경로)"""
+        bits = self._param_bits.get(api_name, 0)
+        symbol_info = self.get_symbol_info(symbol_code)
+
+        # 날짜 파라미터
+        date_1 = None
+        date_2 = None
+        if start_date and bits & _BIT_DATE_1_REQUIRED:
+            date_1 = start_date
+
+        if end_date and bits & _BIT_DATE_2_REQUIRED:
+            date_2 = end_date
+        elif start_date and bits & _BIT_DATE_2_OPTIONAL:
+            date_2 = start_date  # 분봉의 경우 단일 날짜
 
         # 시장/기간 코드 자동 설정
-        if "FID_COND_MRKT_DIV_CODE" in param_template.get("optional", []):
-            params["FID_COND_MRKT_DIV_CODE"] = self.get_market_code(symbol_type)
+        market_code = None
+        if bits & _BIT_MARKET_CODE:
+            market_code = symbol_info.market_code
 
-        if "FID_PERIOD_DIV_CODE" in param_template.get("optional", []):
-            params["FID_PERIOD_DIV_CODE"] = self.get_period_code("일별")
+        period_code = None
+        if bits & _BIT_PERIOD_CODE:
+            period_code = symbol_info.period_code
 
-        # 추가 파라미터 병합
-        params.update(additional_params)
+        # 캐시에 보관되므로 불변 튜플로 반환
+        return ApiParams(symbol_code, date_1, date_2, market_code, period_code)
 
-        return params
+    def build_api_param_bundle(
+        self,
+        api_name: str,
+        symbol_code: str,
+        start_date: str = None,
+        end_date: str = None,
+    ) -> ApiParams:
+        """
+        추가 파라미터를 제외한 기본 API 파라미터를 ApiParams로 반환 (캐시됨)
+
+        Args:
+            api_name (str): API 이름
+            symbol_code (str): 종목코드
+            start_date (str): 시작일 (YYYYMMDD)
+            end_date (str): 종료일 (YYYYMMDD)
+
+        Returns:
+            ApiParams: 기본 API 파라미터 묶음
+        """
+        return self._base_params_cache(api_name, symbol_code, start_date, end_date)
 
     def validate_symbol_code(self, symbol_code: str) -> bool:
         """종목코드 유효성 검증"""
@@ -258,16 +591,26 @@ class ApiConfigManager:
     def reload_config(self):
         """설정 파일 다시 로드"""
         self.config = self._load_config()
+        self._prepare_config()
         logger.info("API 설정 다시 로드 완료")
 
 
 # 전역 설정 관리자 인스턴스
 _config_manager = None
+_config_manager_lock = threading.Lock()
 
 
 def get_api_config() -> ApiConfigManager:
-    """전역 API 설정 관리자 반환"""
+    """전역 API 설정 관리자 반환
+
+    생성 이후에는 잠금 없이 반환하고, 최초 생성만 잠금 안에서 한 번 수행하여
+    여러 스레드가 동시에 처음 호출해도 설정 파일을 한 번만 로드합니다.
+    """
     global _config_manager
-    if _config_manager is None:
-        _config_manager = ApiConfigManager()
-    return _config_manager
+    manager = _config_manager
+    if manager is None:
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ApiConfigManager()
+            manager = _config_manager
+    return manager
@@ -17,15 +17,65 @@ import json
 from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import partial
+import heapq
+import itertools
 import pickle
 import os
+import weakref
+import zlib
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - xxhash 미설치 환경
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 
 
+def _canonicalize(value: Any) -> Any:
+    """
+    캐시 키용으로 값을 정규화 (중첩된 dict까지 키 순서에 무관하게 같은 repr 생성)
+
+    dict는 키로 정렬한 (키, 값) 튜플로, list/tuple은 list로 재귀 변환합니다.
+    (기존 json.dumps(sort_keys=True)와 같은 요청을 같은 키로 취급)
+
+    Args:
+        value (Any): 요청 파라미터/본문 값
+
+    Returns:
+        Any: 정규화된 값
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _canonicalize(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item) for item in value]
+    return value
+
+
+def _hash_cache_key(key_repr: str) -> str:
+    """
+    캐시 키 문자열을 16자리 16진수 해시로 변환
+
+    캐시 키는 프로세스 내부(및 로컬 캐시 파일)에서만 쓰이므로 암호학적 강도가 필요 없습니다.
+    xxhash가 있으면 xxh3_64, 없으면 hashlib.blake2b(8바이트)를 사용합니다.
+
+    Args:
+        key_repr (str): 정규화된 요청 정보 문자열
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    data = key_repr.encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
 @dataclass
 class APIRequest:
     """API 요청 정보를 담는 클래스"""
@@ -174,12 +224,37 @@ class CircuitBreaker:
 class ResponseCache:
     """API 응답 캐싱 시스템"""
 
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 300):
+    # 파일 입출력 버퍼 크기 (작은 객체가 많을 때 write 호출 수 감소)
+    _IO_BUFFER_SIZE = 1 << 20
+
+    # 최대 샤드 수 - 샤드마다 별도 잠금을 두어 배치 요청 스레드 간 경합 감소
+    _MAX_SHARDS = 16
+    # 샤드당 최소 항목 수 - 작은 캐시는 샤드 수를 줄여 LRU 순서를 정확하게 유지
+    _MIN_SHARD_SIZE = 64
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: int = 300,
+        flush_interval: float = 30.0,
+    ):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache = {}
-        self.access_times = {}
-        self.lock = threading.Lock()
+        self.flush_interval = flush_interval
+        # 샤드별 키 -> (응답, 저장 시각, 사용 순번). 삽입/조회 순서가 곧 샤드 내 LRU 순서
+        # (맨 앞이 가장 오래됨). 용량(max_size)은 전체 샤드 합계 기준
+        self._num_shards = max(
+            1, min(self._MAX_SHARDS, max_size // self._MIN_SHARD_SIZE)
+        )
+        self._shards = [OrderedDict() for _ in range(self._num_shards)]
+        self._locks = [threading.Lock() for _ in range(self._num_shards)]
+        # 샤드 간 최근 사용 순서 비교용 순번 (저장/로드 시 전체 LRU 순서 복원)
+        self._clock = itertools.count()
+
+        # 변경 여부 플래그 - put마다 전체 캐시를 쓰지 않고 백그라운드에서 주기적으로 저장
+        self._dirty = threading.Event()
+        self._save_lock = threading.Lock()
+        self._stop_event = threading.Event()
 
         # 캐시 파일 경로 설정
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -191,98 +266,222 @@ class ResponseCache:
         # 캐시 로드
         self._load_cache()
 
+        # 저장 함수와 주기적 저장 스레드는 self를 참조하지 않음
+        # (스레드가 캐시 객체를 붙잡아 두지 않도록 하여 finalize가 동작하게 함)
+        self._flush = partial(
+            self._flush_if_dirty,
+            self._shards,
+            self._locks,
+            self._save_lock,
+            self._dirty,
+            self.cache_file,
+        )
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            args=(self._stop_event, flush_interval, self._flush),
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+        # close()가 호출되지 않아도 객체 소멸 시 또는 인터프리터 종료 시 남은 변경 내용 저장
+        self._finalizer = weakref.finalize(
+            self, self._shutdown, self._stop_event, self._flush_thread, self._flush
+        )
+
     def _generate_cache_key(self, request: APIRequest) -> str:
         """요청 정보로부터 캐시 키 생성"""
-        key_data = {
-            "api_name": request.api_name,
-            "method": request.method,
-            "tr_id": request.tr_id,
-            "params": request.params,
-            "body": request.body,
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        # json 직렬화 대신 키 순서를 (중첩 dict까지) 정렬한 튜플의 repr 사용
+        key_data = (
+            request.api_name,
+            request.method,
+            request.tr_id,
+            _canonicalize(request.params or {}),
+            _canonicalize(request.body or {}),
+        )
+        return _hash_cache_key(repr(key_data))
+
+    def _shard(self, cache_key: str) -> Tuple[OrderedDict, threading.Lock]:
+        """캐시 키가 속한 샤드와 잠금 반환"""
+        # request.cache_key는 임의 문자열일 수 있으므로 16진수 파싱 대신 crc32 사용
+        # (hash()와 달리 프로세스마다 값이 바뀌지 않음)
+        index = zlib.crc32(cache_key.encode()) % self._num_shards
+        return self._shards[index], self._locks[index]
 
     def get(self, request: APIRequest) -> Optional[APIResponse]:
         """캐시에서 응답 조회"""
         cache_key = request.cache_key or self._generate_cache_key(request)
+        shard, lock = self._shard(cache_key)
 
-        with self.lock:
-            if cache_key in self.cache:
-                cached_response, cached_time = self.cache[cache_key]
+        with lock:
+            if cache_key in shard:
+                cached_response, cached_time, _ = shard[cache_key]
 
                 # TTL 확인
                 if time.time() - cached_time <= self.ttl_seconds:
-                    self.access_times[cache_key] = time.time()
+                    shard[cache_key] = (cached_response, cached_time, next(self._clock))
+                    shard.move_to_end(cache_key)
                     cached_response.cached = True
                     logger.debug(f"Cache hit for key: {cache_key[:8]}...")
                     return cached_response
                 else:
                     # 만료된 캐시 제거
-                    del self.cache[cache_key]
-                    if cache_key in self.access_times:
-                        del self.access_times[cache_key]
+                    del shard[cache_key]
 
         return None
 
     def put(self, request: APIRequest, response: APIResponse):
         """응답을 캐시에 저장"""
         cache_key = request.cache_key or self._generate_cache_key(request)
+        shard, lock = self._shard(cache_key)
 
-        with self.lock:
-            # 캐시 크기 제한
-            if len(self.cache) >= self.max_size:
-                self._evict_oldest()
-
-            self.cache[cache_key] = (response, time.time())
-            self.access_times[cache_key] = time.time()
+        with lock:
+            shard[cache_key] = (response, time.time(), next(self._clock))
+            shard.move_to_end(cache_key)
+            self._dirty.set()
             logger.debug(f"Cached response for key: {cache_key[:8]}...")
 
-            # 주기적으로 캐시 저장
-            if len(self.cache) % 10 == 0:
-                self._save_cache()
+        # 캐시 크기 제한 (전체 합계 기준, 모든 샤드 중 가장 오래 사용되지 않은 항목 제거)
+        # 잠금 없이 센 항목 수는 빠른 판단용이며, 제거 여부는 모든 잠금을 잡은 뒤 다시 확인.
+        # 삽입 후에 세므로 동시에 저장한 스레드 중 마지막 스레드는 항상 초과분을 확인함
+        if len(self) > self.max_size:
+            self._evict_to_capacity()
+
+    def _evict_to_capacity(self):
+        """전체 항목 수가 max_size 이하가 될 때까지 사용 순번이 가장 작은 항목부터 제거"""
+        with ExitStack() as stack:
+            # 교착 상태를 피하기 위해 항상 샤드 순서대로 잠금
+            for lock in self._locks:
+                stack.enter_context(lock)
+
+            excess = sum(len(shard) for shard in self._shards) - self.max_size
+            for _ in range(excess):
+                # 각 샤드의 맨 앞 항목이 그 샤드에서 사용 순번이 가장 작음
+                oldest_shard = min(
+                    (shard for shard in self._shards if shard),
+                    key=lambda shard: next(iter(shard.values()))[2],
+                )
+                self._evict_oldest(oldest_shard)
 
-    def _evict_oldest(self):
-        """가장 오래된 캐시 항목 제거 (LRU)"""
-        if not self.access_times:
-            return
+    @staticmethod
+    def _evict_oldest(shard: OrderedDict):
+        """샤드에서 가장 오래 사용되지 않은 캐시 항목 제거 (LRU, O(1))"""
+        if shard:
+            shard.popitem(last=False)
 
-        oldest_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
+    @staticmethod
+    def _flush_loop(
+        stop_event: threading.Event, interval: float, flush: Callable[[], None]
+    ):
+        """interval마다 변경된 캐시를 파일에 저장 (백그라운드 스레드)"""
+        while not stop_event.wait(interval):
+            flush()
+
+    @staticmethod
+    def _shutdown(
+        stop_event: threading.Event,
+        flush_thread: threading.Thread,
+        flush: Callable[[], None],
+    ):
+        """주기적 저장 스레드를 멈추고 남은 변경 내용을 저장 (close/finalize 공용)"""
+        stop_event.set()
+        if flush_thread.is_alive() and flush_thread is not threading.current_thread():
+            flush_thread.join(timeout=5)
+        flush()
+
+    def flush(self):
+        """변경된 내용이 있으면 캐시를 파일에 저장"""
+        self._flush()
+
+    def close(self):
+        """주기적 저장 스레드를 멈추고 남은 변경 내용을 저장 (여러 번 호출해도 안전)"""
+        self._finalizer()
+
+    @classmethod
+    def _flush_if_dirty(
+        cls,
+        shards: List[OrderedDict],
+        locks: List[threading.Lock],
+        save_lock: threading.Lock,
+        dirty: threading.Event,
+        cache_file: str,
+    ):
+        """변경된 내용이 있으면 캐시를 파일에 저장"""
+        if not dirty.is_set():
+            return
 
-        if oldest_key in self.cache:
-            del self.cache[oldest_key]
-        del self.access_times[oldest_key]
+        tmp_file = f"{cache_file}.tmp"
+        # 저장이 겹쳐도 나중에 찍은 스냅샷이 마지막에 기록되도록 저장 잠금 안에서 스냅샷 생성
+        with save_lock:
+            dirty.clear()
+            # 샤드 잠금 안에서는 얕은 복사만 하고 직렬화는 샤드 잠금 밖에서 수행
+            shard_items = []
+            for shard, lock in zip(shards, locks):
+                with lock:
+                    shard_items.append(list(shard.items()))
+            # 각 샤드는 이미 사용 순번 순이므로 병합하면 전체 LRU 순서 (오래된 것부터)
+            merged = OrderedDict(
+                (cache_key, (response, cached_time))
+                for cache_key, (response, cached_time, _) in heapq.merge(
+                    *shard_items, key=lambda item: item[1][2]
+                )
+            )
+            snapshot = {"cache": merged}
 
-    def _save_cache(self):
-        """캐시를 파일에 저장"""
-        try:
-            with open(self.cache_file, "wb") as f:
-                pickle.dump({"cache": self.cache, "access_times": self.access_times}, f)
-        except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+            try:
+                with open(tmp_file, "wb", buffering=cls._IO_BUFFER_SIZE) as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                # 저장 도중 중단되어도 기존 파일이 깨지지 않도록 교체
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                dirty.set()
+                logger.error(f"Failed to save cache: {e}")
+            finally:
+                # 직렬화/교체 실패 시 남은 임시 파일 정리
+                if os.path.exists(tmp_file):
+                    try:
+                        os.remove(tmp_file)
+                    except OSError as e:
+                        logger.error(f"Failed to remove temporary cache file: {e}")
 
     def _load_cache(self):
         """파일에서 캐시 로드"""
         try:
             if os.path.exists(self.cache_file):
-                with open(self.cache_file, "rb") as f:
+                with open(self.cache_file, "rb", buffering=self._IO_BUFFER_SIZE) as f:
                     data = pickle.load(f)
-                    self.cache = data.get("cache", {})
-                    self.access_times = data.get("access_times", {})
-                logger.info(f"Loaded {len(self.cache)} cached responses")
+                    # LRU 순서 유지 (OrderedDict가 아닌 이전 형식은 저장 시각 순으로 정렬)
+                    cache = data.get("cache", {})
+                    if not isinstance(cache, OrderedDict):
+                        cache = OrderedDict(
+                            sorted(cache.items(), key=lambda item: item[1][1])
+                        )
+                # 오래된 것부터 순번을 다시 매기며 적재 (용량 초과분은 가장 오래된 항목부터 제외)
+                items = list(cache.items())
+                for cache_key, (response, cached_time) in items[
+                    max(0, len(items) - self.max_size) :
+                ]:
+                    shard, _ = self._shard(cache_key)
+                    shard[cache_key] = (response, cached_time, next(self._clock))
+                logger.info(f"Loaded {len(self)} cached responses")
         except Exception as e:
             logger.error(f"Failed to load cache: {e}")
-            self.cache = {}
-            self.access_times = {}
+            for shard in self._shards:
+                shard.clear()
+
+    def __len__(self) -> int:
+        """전체 캐시 항목 수"""
+        return sum(len(shard) for shard in self._shards)
 
     def clear(self):
         """캐시 초기화"""
-        with self.lock:
-            self.cache.clear()
-            self.access_times.clear()
         try:
-            if os.path.exists(self.cache_file):
-                os.remove(self.cache_file)
+            with self._save_lock:
+                for shard, lock in zip(self._shards, self._locks):
+                    with lock:
+                        shard.clear()
+                self._dirty.clear()
+                if os.path.exists(self.cache_file):
+                    os.remove(self.cache_file)
         except Exception as e:
             logger.error(f"Failed to remove cache file: {e}")
 
@@ -786,7 +985,7 @@ class APIOptimizer:
             self._batch_thread.join(timeout=5)
 
         # 캐시 저장
-        self.response_cache._save_cache()
+        self.response_cache.close()
         self.date_splitter._save_statistics()
 
         logger.info("🧹 API Optimizer cleanup completed")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+YAML 설정 파일 로더
+
+설정 파일을 mmap으로 매핑한 뒤 libyaml 기반 C 로더로 바로 파싱합니다.
+libyaml이 설치되지 않은 환경에서는 순수 Python SafeLoader를 사용합니다.
+"""
+
+import logging
+import mmap
+import os
+import threading
+from typing import Dict, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# libyaml(C 확장)이 있으면 CSafeLoader, 없으면 SafeLoader 사용
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 파싱된 설정 캐시: 절대 경로 -> ((mtime_ns, 파일 크기), 설정)
+# 여러 FeatureManager가 같은 파일을 읽어도 파일이 바뀌지 않았다면 재파싱하지 않음
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def load_yaml(file_path: str) -> Dict:
+    """YAML 설정 파일 로드
+
+    같은 경로의 파일은 수정 시각(mtime_ns)과 크기가 바뀌지 않는 한 캐시된 결과를 반환합니다.
+    반환된 딕셔너리는 호출자 간에 공유되므로 수정이 필요하면 복사해서 사용해야 합니다.
+
+    Args:
+        file_path: YAML 파일 경로
+
+    Returns:
+        Dict: 로드된 설정 정보 (파일이 없거나 비어 있으면 빈 딕셔너리)
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        logger.warning(f"설정 파일이 존재하지 않습니다: {file_path}")
+        return {}
+
+    # 빈 파일은 mmap 할 수 없으므로 바로 반환
+    if stat.st_size == 0:
+        logger.warning(f"설정 파일이 비어 있습니다: {file_path}")
+        return {}
+
+    cache_key = os.path.abspath(file_path)
+    # 같은 mtime 해상도 안에서 다시 쓰인 파일도 크기로 구분
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            logger.debug(f"캐시된 설정 사용: {file_path}")
+            return cached[1]
+
+    try:
+        with open(file_path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                config = yaml.load(mm, Loader=_SafeLoader) or {}
+        logger.info(f"설정 파일 로드 성공: {file_path}")
+    except Exception as e:
+        logger.error(f"설정 파일 로드 중 오류 발생: {file_path}, {str(e)}")
+        return {}
+
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[cache_key] = (stamp, config)
+    return config
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+run_data_collector CSV 저장 형식 테스트
+
+PyArrow 경로로 저장한 CSV가 pandas `to_csv`와 바이트 단위로 같은지 확인합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data_collection.run_data_collector import (
+    _append_csv,
+    _arrow_csv_bytes,
+    _write_csv_fast,
+)
+
+
+def _mixed_frame() -> pd.DataFrame:
+    """정수/문자열/실수/날짜/bool/결측이 섞인 DataFrame"""
+    return pd.DataFrame(
+        {
+            "stck_bsop_date": ["20240102", "20240103", "20240104"],
+            "code": ["A0001", "B 0002", None],
+            "volume": np.array([1, -2, 3], dtype=np.int32),
+            "amount": pd.array([10, None, 30], dtype="Int64"),
+            "close": [1.5, 2.0, 1e-05],
+            "ratio": np.array([0.1, 16777217, np.nan], dtype=np.float32),
+            "trade_date": pd.to_datetime(["2024-01-02", "2024-01-03", None]),
+            "is_call": [True, False, True],
+            "memo": ["a,b", 'c"d', "e"],
+        }
+    )
+
+
+def _expected_csv(df: pd.DataFrame, tmp_path) -> bytes:
+    path = tmp_path / "expected.csv"
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+    df.to_csv(path, index=False, mode="a", header=False, encoding="utf-8")
+    return path.read_bytes()
+
+
+def _written_csv(df: pd.DataFrame, tmp_path) -> bytes:
+    path = str(tmp_path / "written.csv")
+    _write_csv_fast(df, path)
+    _append_csv(df, path)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_mixed_dtype_frame_matches_to_csv(tmp_path):
+    df = _mixed_frame()
+    assert _written_csv(df, tmp_path) == _expected_csv(df, tmp_path)
+
+
+def test_arrow_path_matches_to_csv(tmp_path):
+    # PyArrow로 처리하는 정수/문자열 컬럼만 있는 경우
+    df = _mixed_frame()[["stck_bsop_date", "code", "volume", "amount"]]
+    assert _arrow_csv_bytes(df, "arrow.csv", include_header=True) is not None
+    assert _written_csv(df, tmp_path) == _expected_csv(df, tmp_path)
+
+
+def test_each_column_matches_to_csv(tmp_path):
+    df = _mixed_frame()
+    for col in df.columns:
+        single = df[[col]]
+        assert _written_csv(single, tmp_path) == _expected_csv(single, tmp_path), col